@@ -0,0 +1,15 @@
+"""Matplotlib canvas for climate_gui, imported once the window is up."""
+import matplotlib as mpl
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+class RcCanvas(FigureCanvasTkAgg):
+    """TkAgg canvas that renders under a fixed set of rcParams."""
+    def __init__(self, figure, master, rc):
+        super().__init__(figure, master=master)
+        self.rc = rc
+
+    def draw(self):
+        # Agg reads the path.* and agg.path.* settings at render time, which
+        # draw_idle runs outside any rc_context set up while building artists
+        with mpl.rc_context(self.rc):
+            super().draw()
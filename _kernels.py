@@ -0,0 +1,211 @@
+"""Numeric kernels for climate_analysis, compiled with numba when it is installed."""
+import numpy as np
+import warnings
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+def linear_fit(x, y):
+    """Least-squares slope and intercept of y (or each column of y) against x, skipping NaN."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if y.ndim > 1:
+        x = x[:, np.newaxis]
+    valid = ~np.isnan(y)
+    n = valid.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x_mean = np.where(valid, x, 0.0).sum(axis=0) / n
+        y_mean = np.where(valid, y, 0.0).sum(axis=0) / n
+        dx = np.where(valid, x - x_mean, 0.0)
+        slope = (dx * np.where(valid, y - y_mean, 0.0)).sum(axis=0) / (dx * dx).sum(axis=0)
+    return slope, y_mean - slope * x_mean
+
+def _window_sums(values, window):
+    """Sum of each trailing window (NaN as 0) and how many NaNs it holds, via cumsum."""
+    gaps = np.isnan(values)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(gaps, 0.0, values))))
+    counts = np.concatenate(([0], np.cumsum(gaps)))
+    return sums[window:] - sums[:-window], counts[window:] - counts[:-window]
+
+def rolling_mean(values, window=10):
+    """Trailing moving average, NaN-padded like pandas' rolling(window).mean()."""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        total, gaps = _window_sums(values, window)
+        out[window - 1:] = np.where(gaps == 0, total / window, np.nan)
+    return out
+
+def rolling_std(values, window=10):
+    """Trailing sample standard deviation, like pandas' rolling(window).std()."""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        total, gaps = _window_sums(values, window)
+        total_sq, _ = _window_sums(values * values, window)
+        mean = total / window
+        variance = np.maximum(total_sq / window - mean * mean, 0.0) * window / (window - 1)
+        out[window - 1:] = np.where(gaps == 0, np.sqrt(variance), np.nan)
+    return out
+
+def _annual_trend_loop(years, temps, window):
+    # Single pass over the series: Welford updates for the linear fit
+    # (over non-NaN years), running sums (with a NaN count) for the trailing
+    # window, and the year-over-year difference. Written to compile under numba.njit.
+    n = temps.shape[0]
+    rolling_mean = np.full(n, np.nan)
+    rolling_std = np.full(n, np.nan)
+    diff = np.full(n, np.nan)
+    mean_x = mean_y = cov_xy = var_x = 0.0
+    total = total_sq = 0.0
+    gaps = 0
+    k = 0
+    for i in range(n):
+        x = years[i]
+        y = temps[i]
+        if i > 0:
+            diff[i] = y - temps[i - 1]
+        if y == y:
+            k += 1
+            dx = x - mean_x
+            mean_x += dx / k
+            mean_y += (y - mean_y) / k
+            cov_xy += dx * (y - mean_y)
+            var_x += dx * (x - mean_x)
+            total += y
+            total_sq += y * y
+        else:
+            gaps += 1
+        if i >= window:
+            old = temps[i - window]
+            if old == old:
+                total -= old
+                total_sq -= old * old
+            else:
+                gaps -= 1
+        if i >= window - 1 and gaps == 0:
+            m = total / window
+            rolling_mean[i] = m
+            rolling_std[i] = np.sqrt(max(total_sq / window - m * m, 0.0) * window / (window - 1))
+    slope = cov_xy / var_x
+    intercept = mean_y - slope * mean_x
+    trend = slope * years + intercept
+    return trend, rolling_mean, rolling_std, diff, slope, intercept
+
+def _annual_trend_numpy(years, temps, window):
+    slope, intercept = linear_fit(years, temps)
+    diff = np.full(len(temps), np.nan)
+    diff[1:] = np.diff(temps)
+    return (slope * years + intercept, rolling_mean(temps, window),
+            rolling_std(temps, window), diff, slope, intercept)
+
+_annual_trend_kernel = njit(cache=True)(_annual_trend_loop) if njit is not None else _annual_trend_numpy
+
+def _row_nanmean_loop(block):
+    out = np.empty(block.shape[0], dtype=np.float32)
+    for i in prange(block.shape[0]):
+        total = 0.0
+        count = 0
+        for j in range(block.shape[1]):
+            v = block[i, j]
+            if v == v:
+                total += v
+                count += 1
+        out[i] = total / count if count else np.nan
+    return out
+
+def _row_nanmean_numpy(block):
+    # Rows with no months yet (e.g. a partial current year) are NaN, as
+    # with DataFrame.mean(axis=1), without the "Mean of empty slice" warning
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        return np.nanmean(block, axis=1)
+
+row_nanmean = njit(cache=True, parallel=True)(_row_nanmean_loop) if njit is not None else _row_nanmean_numpy
+
+def _decadal_loop(years, temps):
+    # years sorted; one pass accumulating count, sum and sum of squares per decade
+    n = years.shape[0]
+    decades = np.empty(n, dtype=np.int32)
+    count = np.zeros(n, dtype=np.int64)
+    total = np.zeros(n)
+    total_sq = np.zeros(n)
+    g = -1
+    for i in range(n):
+        d = (years[i] // 10) * 10
+        if g < 0 or d != decades[g]:
+            g += 1
+            decades[g] = d
+        y = temps[i]
+        if y == y:
+            count[g] += 1
+            total[g] += y
+            total_sq[g] += y * y
+    g += 1
+    return decades[:g], count[:g], total[:g], total_sq[:g]
+
+def _decadal_numpy(years, temps):
+    decades = (years // 10) * 10
+    starts = np.concatenate((np.zeros(1, dtype=np.int64), np.flatnonzero(np.diff(decades) != 0) + 1))
+    valid = ~np.isnan(temps)
+    values = np.where(valid, temps, 0.0)
+    return (decades[starts], np.add.reduceat(valid.astype(np.int64), starts),
+            np.add.reduceat(values, starts), np.add.reduceat(values * values, starts))
+
+_decadal_kernel = njit(cache=True)(_decadal_loop) if njit is not None else _decadal_numpy
+
+def group_by_decade(years, temps):
+    """Decade start, NaN-skipping mean, sample std and count of temps per decade."""
+    years = np.ascontiguousarray(years, dtype=np.int32)
+    temps = np.ascontiguousarray(temps, dtype=np.float64)
+    if len(years) > 1 and (np.diff(years) < 0).any():
+        # Each decade must be one run; the source file is normally sorted
+        order = np.argsort(years, kind='stable')
+        years, temps = years[order], temps[order]
+    if len(years) == 0:
+        return years, np.zeros(0), np.zeros(0), np.zeros(0, dtype=np.int64)
+    decades, count, total, total_sq = _decadal_kernel(years, temps)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+        std = np.sqrt(np.maximum(total_sq - total * mean, 0.0) / (count - 1))
+    std[count < 2] = np.nan
+    return decades, mean, std, count
+
+def annual_trend_stats(years, temps, window=10):
+    """Trend line, rolling mean/std, year-over-year change, slope and intercept."""
+    years = np.ascontiguousarray(years, dtype=np.float64)
+    temps = np.ascontiguousarray(temps, dtype=np.float64)
+    return _annual_trend_kernel(years, temps, window)
+
+def minmax_decimate(x, y, n_buckets):
+    """Thin (x, y) to the min and max of y in each of n_buckets equal-count buckets.
+
+    Keeps the drawn envelope of a long line while handing the renderer
+    about 2 * n_buckets points. Short series are returned unchanged.
+    """
+    n = len(x)
+    if n <= 2 * n_buckets:
+        return x, y
+    size = n // n_buckets
+    m = size * n_buckets
+    block = np.asarray(y[:m], dtype=np.float64).reshape(n_buckets, size)
+    nan = np.isnan(block)
+    lo = np.argmin(np.where(nan, np.inf, block), axis=1)
+    hi = np.argmax(np.where(nan, -np.inf, block), axis=1)
+    base = np.arange(0, m, size)
+    # Each bucket's two points in x order, then whatever did not fill a bucket
+    idx = np.column_stack([np.minimum(lo, hi), np.maximum(lo, hi)]) + base[:, np.newaxis]
+    idx = np.concatenate([idx.ravel(), np.arange(m, n)])
+    return x[idx], y[idx]
+
+def warm_up():
+    """Compile the numba kernels (or load them from numba's cache) ahead of first use."""
+    if njit is None:
+        return
+    years = np.arange(12, dtype=np.float64)
+    annual_trend_stats(years, years)
+    group_by_decade(years, years)
+    row_nanmean(np.zeros((2, 12), dtype=np.float32))
@@ -1,53 +1,126 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from sklearn.preprocessing import StandardScaler
-from sklearn.impute import SimpleImputer
-from scipy import stats
+import gzip
+import io
 import os
 from datetime import datetime
+import functools
+import threading
+
+from _kernels import annual_trend_stats, group_by_decade, linear_fit, row_nanmean
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = pa_csv = None
+
+MISSING_VALUE = '*******'
+DATASETS = ['AIRS v6', 'AIRS v7', 'GHCNv4/ERSSTv5']
+DEFAULT_DATASET = 'GHCNv4/ERSSTv5'
+MONTH_COLUMNS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+SEASON_COLUMNS = ['DJF', 'MAM', 'JJA', 'SON']
+TREND_COLUMNS = ['annual_temp'] + SEASON_COLUMNS
+# Bump when _clean changes so stale Parquet caches are not picked up
+CACHE_VERSION = 3
+PLOTS_DIR = 'plots'
+OUTPUT_DIR = 'outputs'
+# Above this many samples a trace is thinned with LTTB before it reaches Plotly
+MAX_PLOT_POINTS = 1000
+STATS_TEMPLATE = """Climate Analysis Statistics
+=========================
+
+Dataset: {dataset}
+Year Range: {start} - {end}
+
+Extreme Values:
+Warmest Year: {warmest_year} ({warmest_temp:.3f}°C)
+Coldest Year: {coldest_year} ({coldest_temp:.3f}°C)
+
+Temperature Trends:
+Linear Trend: {linear_trend:.4f}°C/year
+Quadratic Trend: {quadratic_trend:.4f}°C/year²
+10-Year Rolling Standard Deviation: {rolling_std:.4f}°C
+
+Seasonal Trends (°C/year):
+{seasonal}
+
+Temperature Variability:
+Annual Standard Deviation: {annual_std:.4f}°C
+Monthly Standard Deviation: {monthly_std:.4f}°C
+Seasonal Standard Deviation: {seasonal_std:.4f}°C
+"""
+
+def _lttb_indices(x, y, n_out):
+    """Indices of a largest-triangle-three-buckets downsample of (x, y) to n_out points."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    # n_out - 2 buckets between the first and last point, which are always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        cx = x[stop:next_stop].mean()
+        cy = y[stop:next_stop].mean()
+        area = np.abs((x[a] - cx) * (y[start:stop] - y[a])
+                      - (x[a] - x[start:stop]) * (cy - y[a]))
+        a = start + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+def _ensure_dir(path):
+    """Create an output directory if it is missing and return its path."""
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def _cached_per_dataset(method):
+    """Memoize a no-argument method's result per (dataset_type, method)."""
+    @functools.wraps(method)
+    def wrapper(self):
+        key = (self.dataset_type, method.__name__)
+        if key not in self._cache:
+            self._cache[key] = method(self)
+        return self._cache[key]
+    return wrapper
 
 class ClimateAnalysis:
     def __init__(self, data_path='data/GLB.Ts+dSST.csv'):
         self.data_path = data_path
         self.df = None
         self.dataset_type = None
+        # Column arrays of the active dataset, shared by the plots and stats
+        self.years = None
+        self.monthly = None
+        self.monthly_image = None
+        self.annual = None
+        self.seasonal = None
+        self._cleaned = {}
+        self._trends = {}
+        self._cache = {}
+        self._written = {}
         self.load_and_clean_data()
 
     def load_and_clean_data(self):
         try:
-            with open(self.data_path, 'r') as file:
-                content = file.readlines()
-
-            sections = {
-                'AIRS v6': [],
-                'AIRS v7': [],
-                'GHCNv4/ERSSTv5': []
-            }
-            
-            current_section = None
-            for line in content:
-                if 'AIRS v6' in line:
-                    current_section = 'AIRS v6'
-                elif 'AIRS v7' in line:
-                    current_section = 'AIRS v7'
-                elif 'GHCNv4/ERSSTv5' in line:
-                    current_section = 'GHCNv4/ERSSTv5'
-                elif current_section and line.strip():
-                    sections[current_section].append(line)
-
-            self.dataset_type = 'GHCNv4/ERSSTv5'
-            data_lines = sections[self.dataset_type]
-            
-            header = data_lines[0].strip().split(',')
-            data = [line.strip().split(',') for line in data_lines[1:]]
-            
-            self.df = pd.DataFrame(data, columns=header)
-            self.clean_data()
+            sections = None
+            for name in DATASETS:
+                df = self._read_cache(name)
+                if df is None:
+                    if sections is None:
+                        sections = self._read_sections()
+                    df = self._clean(self._parse_section(sections[name]))
+                    self._write_cache(name, df)
+                self._cleaned[name] = df
+                self._trends[name] = self._fit_trends(df)
+
+            self._activate(DEFAULT_DATASET)
             
             print("Data loaded and cleaned successfully!")
             print(f"Dataset covers years from {self.df['Year'].min()} to {self.df['Year'].max()}")
@@ -56,81 +129,187 @@ class ClimateAnalysis:
             print(f"Error loading data: {str(e)}")
             raise
 
-    def clean_data(self):
-        self.df['Year'] = pd.to_numeric(self.df['Year'], errors='coerce')
-        
-        month_columns = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                        'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        
-        for col in month_columns:
-            self.df[col] = self.df[col].replace('*******', np.nan)
-            self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+    def _cache_path(self, name):
+        slug = ''.join(c if c.isalnum() else '_' for c in name.lower())
+        root = os.path.splitext(self.data_path)[0]
+        return f"{root}.cleaned.v{CACHE_VERSION}.{slug}.parquet"
+
+    def _read_cache(self, name):
+        """Return the cleaned section from Parquet if it is newer than the CSV."""
+        path = self._cache_path(name)
+        if pa_csv is None or not os.path.exists(path):
+            return None
+        if os.path.getmtime(path) <= os.path.getmtime(self.data_path):
+            return None
+        try:
+            return pd.read_parquet(path, engine='pyarrow')
+        except Exception as e:
+            print(f"Error reading cache {path}: {e}")
+            return None
+
+    def _write_cache(self, name, df):
+        if pa_csv is None:
+            return
+        path = self._cache_path(name)
+        try:
+            df.to_parquet(path, engine='pyarrow', compression='zstd')
+        except Exception as e:
+            print(f"Error writing cache {path}: {e}")
+
+    def _read_sections(self):
+        with open(self.data_path, 'r') as file:
+            content = file.read()
+
+        # Only the section title lines are located in Python; everything
+        # between two titles goes to the CSV parser as a single block.
+        bounds = []
+        for name in DATASETS:
+            title = content.find(name)
+            if title == -1:
+                raise ValueError(f"Section '{name}' not found in {self.data_path}")
+            line_start = content.rfind('\n', 0, title) + 1
+            body_start = content.find('\n', title) + 1 or len(content)
+            bounds.append((line_start, body_start, name))
+        bounds.sort()
+
+        sections = {}
+        ends = [line_start for line_start, _, _ in bounds[1:]] + [len(content)]
+        for (_, body_start, name), end in zip(bounds, ends):
+            sections[name] = content[body_start:end]
+        return sections
+
+    def _parse_section(self, text):
+        # GISS pads values with spaces after each comma; strip them in one pass
+        # so both parsers see plain numbers and '*******' as a null token.
+        text = text.replace(' ', '')
+        temp_columns = MONTH_COLUMNS + SEASON_COLUMNS
+        # J-D and D-N are never used (annual_temp is recomputed), so skip them
+        columns = ['Year'] + temp_columns
+        if pa_csv is not None:
+            table = pa_csv.read_csv(
+                io.BytesIO(text.encode()),
+                read_options=pa_csv.ReadOptions(use_threads=True),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={col: pa.float32() for col in temp_columns},
+                    null_values=[MISSING_VALUE],
+                    strings_can_be_null=True,
+                    include_columns=columns
+                )
+            )
+            return table.to_pandas()
+        return pd.read_csv(io.StringIO(text), usecols=columns, na_values=[MISSING_VALUE],
+                           dtype={col: np.float32 for col in temp_columns})
+
+    def _clean(self, df):
+        df['Year'] = pd.to_numeric(df['Year'], errors='coerce')
         
-        season_columns = ['DJF', 'MAM', 'JJA', 'SON']
-        for col in season_columns:
-            self.df[col] = self.df[col].replace('*******', np.nan)
-            self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+        # Columns the parser could not type come back as strings; clear the
+        # sentinel on the whole block at once and narrow to float32.
+        temp_columns = MONTH_COLUMNS + SEASON_COLUMNS
+        block = df[temp_columns].to_numpy()
+        if block.dtype == object:
+            block[block == MISSING_VALUE] = np.nan
+        block = block.astype(np.float32, copy=False)
+        df[temp_columns] = block
         
-        self.df['annual_temp'] = self.df[month_columns].mean(axis=1)
+        df['annual_temp'] = row_nanmean(np.ascontiguousarray(block[:, :len(MONTH_COLUMNS)]))
         
-        self.df = self.df.dropna(subset=['Year'])
-        self.df = self.df[self.df['Year'] != '*******']
+        df = df.loc[df['Year'].notna()].reset_index(drop=True)
+        return df.astype({'Year': np.int16})
+
+    def _fit_trends(self, df):
+        # All linear trends come from one vectorized solve over the stacked
+        # columns; missing values (e.g. seasons of a partial year) are skipped.
+        years = df['Year'].to_numpy(dtype=np.float64)
+        slopes, intercepts = linear_fit(years, df[TREND_COLUMNS].to_numpy())
+        trends = {col: np.array([slopes[i], intercepts[i]]) for i, col in enumerate(TREND_COLUMNS)}
+        trends['quadratic'] = np.polyfit(years, df['annual_temp'], 2)
+        return trends
+
+    def linear_trend(self, column):
+        """(slope, intercept) of column against Year for the active dataset."""
+        slope, intercept = self._trends[self.dataset_type][column]
+        return slope, intercept
+
+    def trend_line(self, column):
+        """Fitted linear trend of column at each year, as float32."""
+        return self._trend_lines()[column]
+
+    @_cached_per_dataset
+    def _trend_lines(self):
+        # Every TREND_COLUMNS line in one broadcast, evaluated once per dataset
+        trends = self._trends[self.dataset_type]
+        slopes, intercepts = np.array([trends[col] for col in TREND_COLUMNS], dtype=np.float64).T
+        lines = (self.years[:, np.newaxis] * slopes + intercepts).astype(np.float32)
+        return {col: lines[:, i] for i, col in enumerate(TREND_COLUMNS)}
 
     def change_dataset(self, dataset_type):
-        if dataset_type in ['AIRS v6', 'AIRS v7', 'GHCNv4/ERSSTv5']:
-            self.dataset_type = dataset_type
-            self.load_and_clean_data()
-        else:
+        if dataset_type not in self._cleaned:
             raise ValueError("Invalid dataset type")
+        self._activate(dataset_type)
+
+    def _activate(self, dataset_type):
+        self.dataset_type = dataset_type
+        self.df = self._cleaned[dataset_type]
+        self.years = self.df['Year'].to_numpy(dtype=np.int32)
+        self.monthly = np.ascontiguousarray(self.df[MONTH_COLUMNS].to_numpy(dtype=np.float32))
+        # Months as rows, the layout the heatmaps hand to imshow
+        self.monthly_image = np.ascontiguousarray(self.monthly.T)
+        self.annual = self.df['annual_temp'].to_numpy(dtype=np.float32)
+        self.seasonal = {s: self.df[s].to_numpy(dtype=np.float32) for s in SEASON_COLUMNS}
+
+    @_cached_per_dataset
+    def _annual_stats(self):
+        """(trend, rolling mean, rolling std, YoY change, slope, intercept) for annual_temp."""
+        return annual_trend_stats(self.years, self.annual)
 
+    def annual_rolling_mean(self):
+        """10-year trailing mean of annual_temp, NaN until the window is full."""
+        return self._annual_stats()[1]
+
+    @_cached_per_dataset
     def plot_global_temperature_trend(self):
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
         if 'Year' in self.df.columns and 'annual_temp' in self.df.columns:
             fig = make_subplots(specs=[[{"secondary_y": True}]])
+            years = self.years
+            temps = self.annual
+            trend_line, rolling_avg, _, temp_change, slope, _ = self._annual_stats()
+            # Stats are computed on the full series; only the plotted samples are thinned
+            keep = _lttb_indices(years, temps, MAX_PLOT_POINTS)
+            years = years[keep]
             
-            fig.add_trace(
-                go.Scatter(
-                    x=self.df['Year'],
-                    y=self.df['annual_temp'],
-                    name="Annual Temperature",
-                    mode='lines+markers',
-                    marker=dict(size=6)
-                ),
-                secondary_y=False
-            )
-            
-            z = np.polyfit(self.df['Year'], self.df['annual_temp'], 1)
-            p = np.poly1d(z)
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=self.df['Year'],
-                    y=p(self.df['Year']),
-                    name=f'Trend Line (slope: {z[0]:.4f}°C/year)',
-                    line=dict(color='red', dash='dash')
-                ),
-                secondary_y=False
-            )
-            
-            rolling_avg = self.df['annual_temp'].rolling(window=10).mean()
-            fig.add_trace(
-                go.Scatter(
-                    x=self.df['Year'],
-                    y=rolling_avg,
-                    name='10-Year Moving Average',
-                    line=dict(color='green')
-                ),
-                secondary_y=False
-            )
-            
-            temp_change = self.df['annual_temp'].diff()
-            fig.add_trace(
-                go.Scatter(
-                    x=self.df['Year'],
-                    y=temp_change,
-                    name='Year-over-Year Change',
-                    line=dict(color='orange')
-                ),
-                secondary_y=True
+            # One batched call instead of four incremental layout validations
+            fig.add_traces(
+                [
+                    go.Scatter(
+                        x=years,
+                        y=temps[keep],
+                        name="Annual Temperature",
+                        mode='lines+markers',
+                        marker=dict(size=6)
+                    ),
+                    go.Scatter(
+                        x=years,
+                        y=trend_line[keep],
+                        name=f'Trend Line (slope: {slope:.4f}°C/year)',
+                        line=dict(color='red', dash='dash')
+                    ),
+                    go.Scatter(
+                        x=years,
+                        y=rolling_avg[keep],
+                        name='10-Year Moving Average',
+                        line=dict(color='green')
+                    ),
+                    go.Scatter(
+                        x=years,
+                        y=temp_change[keep],
+                        name='Year-over-Year Change',
+                        line=dict(color='orange')
+                    )
+                ],
+                secondary_ys=[False, False, False, True]
             )
             
             fig.update_layout(
@@ -147,17 +326,13 @@ class ClimateAnalysis:
         else:
             print("Required columns not found in dataset")
 
+    @_cached_per_dataset
     def plot_monthly_trends(self):
-        month_columns = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                        'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        
-        monthly_data = self.df[['Year'] + month_columns].copy()
-        monthly_data = monthly_data.melt(
-            id_vars=['Year'], 
-            value_vars=month_columns,
-            var_name='Month', 
-            value_name='Temperature'
-        )
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        month_columns = MONTH_COLUMNS
+        # One read-only block feeds both the heatmap and the box plots
+        monthly = self.monthly
         
         fig = make_subplots(
             rows=2, cols=1,
@@ -166,24 +341,39 @@ class ClimateAnalysis:
             row_heights=[0.7, 0.3]
         )
         
+        # float32 values serialize with float64 repr noise (0.1230000034...);
+        # the source has three decimals, so round once for a compact JSON
+        # payload and feed both traces from the rounded block
+        monthly = np.round(monthly.astype(np.float64), 3)
         heatmap = go.Heatmap(
-            x=monthly_data['Month'],
-            y=monthly_data['Year'],
-            z=monthly_data['Temperature'],
+            x=month_columns,
+            y=self.years,
+            z=monthly,
             colorscale='RdBu_r',
             colorbar=dict(title='Temperature Anomaly (°C)')
         )
         fig.add_trace(heatmap, row=1, col=1)
         
-        for month in month_columns:
-            fig.add_trace(
-                go.Box(
-                    y=self.df[month],
-                    name=month,
-                    boxpoints='outliers'
-                ),
-                row=2, col=1
-            )
+        # Quartiles, whiskers and outliers are computed here once so the
+        # browser draws a single precomputed box trace for all months.
+        q1, median, q3 = np.round(np.nanquantile(monthly, [0.25, 0.5, 0.75], axis=0), 3)
+        iqr = q3 - q1
+        inside = (monthly >= q1 - 1.5 * iqr) & (monthly <= q3 + 1.5 * iqr)
+        outside = ~inside & ~np.isnan(monthly)
+        fig.add_trace(
+            go.Box(
+                x=month_columns,
+                q1=q1,
+                median=median,
+                q3=q3,
+                lowerfence=np.nanmin(np.where(inside, monthly, np.nan), axis=0),
+                upperfence=np.nanmax(np.where(inside, monthly, np.nan), axis=0),
+                y=[monthly[outside[:, i], i] for i in range(len(month_columns))],
+                name='Monthly Distribution',
+                boxpoints='outliers'
+            ),
+            row=2, col=1
+        )
         
         fig.update_layout(
             height=1000,
@@ -193,9 +383,18 @@ class ClimateAnalysis:
         
         return fig
 
+    @_cached_per_dataset
+    def decadal_stats(self):
+        """Per-decade mean, std and count of annual_temp."""
+        decades, mean, std, count = group_by_decade(self.years, self.annual)
+        return pd.DataFrame({'mean': mean, 'std': std, 'count': count},
+                            index=pd.Index(decades, name='Decade'))
+
+    @_cached_per_dataset
     def calculate_decadal_changes(self):
-        self.df['Decade'] = (self.df['Year'] // 10) * 10
-        decadal_avg = self.df.groupby('Decade')['annual_temp'].agg(['mean', 'std', 'count'])
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        decadal_avg = self.decadal_stats()
         decadal_change = decadal_avg['mean'].diff()
         
         fig = make_subplots(
@@ -204,48 +403,42 @@ class ClimateAnalysis:
             vertical_spacing=0.2
         )
         
-        fig.add_trace(
-            go.Bar(
-                x=decadal_change.index,
-                y=decadal_change.values,
-                name='Temperature Change',
-                text=decadal_change.values.round(3),
-                textposition='auto'
-            ),
-            row=1, col=1
-        )
-        
-        fig.add_trace(
-            go.Scatter(
-                x=decadal_avg.index,
-                y=decadal_avg['mean'],
-                name='Mean Temperature',
-                mode='lines+markers'
-            ),
-            row=2, col=1
-        )
-        
-        fig.add_trace(
-            go.Scatter(
-                x=decadal_avg.index,
-                y=decadal_avg['mean'] + decadal_avg['std'],
-                name='Upper Bound',
-                line=dict(dash='dash'),
-                showlegend=False
-            ),
-            row=2, col=1
-        )
-        
-        fig.add_trace(
-            go.Scatter(
-                x=decadal_avg.index,
-                y=decadal_avg['mean'] - decadal_avg['std'],
-                name='Lower Bound',
-                line=dict(dash='dash'),
-                showlegend=False,
-                fill='tonexty'
-            ),
-            row=2, col=1
+        decades = decadal_avg.index.to_numpy()
+        mean = decadal_avg['mean'].to_numpy()
+        std = decadal_avg['std'].to_numpy()
+        change = decadal_change.to_numpy()
+        fig.add_traces(
+            [
+                go.Bar(
+                    x=decades,
+                    y=change,
+                    name='Temperature Change',
+                    text=change.round(3),
+                    textposition='auto'
+                ),
+                go.Scatter(
+                    x=decades,
+                    y=mean,
+                    name='Mean Temperature',
+                    mode='lines+markers'
+                ),
+                go.Scatter(
+                    x=decades,
+                    y=mean + std,
+                    name='Upper Bound',
+                    line=dict(dash='dash'),
+                    showlegend=False
+                ),
+                go.Scatter(
+                    x=decades,
+                    y=mean - std,
+                    name='Lower Bound',
+                    line=dict(dash='dash'),
+                    showlegend=False,
+                    fill='tonexty'
+                )
+            ],
+            rows=[1, 2, 2, 2], cols=[1, 1, 1, 1]
         )
         
         fig.update_layout(
@@ -257,46 +450,94 @@ class ClimateAnalysis:
         
         return fig
 
+    @_cached_per_dataset
+    def monthly_summary(self):
+        """describe() of the month columns, computed once per dataset."""
+        return self.df[MONTH_COLUMNS].describe()
+
+    @_cached_per_dataset
     def calculate_statistics(self):
         stats = {}
         
+        temps = self.annual
+        years = self.years
+        warmest = int(np.nanargmax(temps))
+        coldest = int(np.nanargmin(temps))
         stats['extremes'] = {
-            'warmest_temp': self.df['annual_temp'].max(),
-            'coldest_temp': self.df['annual_temp'].min(),
-            'warmest_year': self.df.loc[self.df['annual_temp'].idxmax(), 'Year'],
-            'coldest_year': self.df.loc[self.df['annual_temp'].idxmin(), 'Year']
+            'warmest_temp': temps[warmest],
+            'coldest_temp': temps[coldest],
+            'warmest_year': years[warmest],
+            'coldest_year': years[coldest]
         }
         
+        trends = self._trends[self.dataset_type]
         stats['trends'] = {
-            'linear_trend': np.polyfit(self.df['Year'], self.df['annual_temp'], 1)[0],
-            'quadratic_trend': np.polyfit(self.df['Year'], self.df['annual_temp'], 2)[0],
-            'rolling_std': self.df['annual_temp'].rolling(window=10).std().mean()
+            'linear_trend': trends['annual_temp'][0],
+            'quadratic_trend': trends['quadratic'][0],
+            'rolling_std': np.nanmean(self._annual_stats()[2])
         }
         
-        stats['seasonal_trends'] = {
-            'DJF': np.polyfit(self.df['Year'], self.df['DJF'], 1)[0],
-            'MAM': np.polyfit(self.df['Year'], self.df['MAM'], 1)[0],
-            'JJA': np.polyfit(self.df['Year'], self.df['JJA'], 1)[0],
-            'SON': np.polyfit(self.df['Year'], self.df['SON'], 1)[0]
-        }
+        stats['seasonal_trends'] = {season: trends[season][0] for season in SEASON_COLUMNS}
         
         stats['variability'] = {
-            'annual_std': self.df['annual_temp'].std(),
-            'monthly_std': self.df[['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']].std().mean(),
-            'seasonal_std': self.df[['DJF', 'MAM', 'JJA', 'SON']].std().mean()
+            'annual_std': np.nanstd(self.annual.astype(np.float64), ddof=1),
+            'monthly_std': self.monthly_summary().loc['std'].mean(),
+            'seasonal_std': np.mean([np.nanstd(self.seasonal[s].astype(np.float64), ddof=1)
+                                     for s in SEASON_COLUMNS])
         }
         
         return stats
 
-    def save_plot(self, fig, filename):
-        if not os.path.exists('plots'):
-            os.makedirs('plots')
-        
+    def save_plot(self, fig, filename, compress=False):
+        # The plot_* figures are memoized, so saving the same one again
+        # would only produce an identical file under a new timestamp.
+        written = self._written.get((filename, compress))
+        if written is not None and written[0] is fig and os.path.exists(written[1]):
+            print(f"Plot unchanged, already saved to {written[1]}")
+            return written[1]
+
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filepath = os.path.join('plots', f'{filename}_{timestamp}.html')
-        fig.write_html(filepath)
+        filepath = os.path.join(_ensure_dir(PLOTS_DIR), f'{filename}_{timestamp}.html')
+        # plotly.js is loaded from the CDN instead of being inlined (~3 MB per file)
+        html_options = dict(include_plotlyjs='cdn', include_mathjax=False, full_html=True,
+                            validate=False, config={'responsive': True})
+        if compress:
+            filepath += '.gz'
+            with gzip.open(filepath, 'wt', encoding='utf-8') as f:
+                f.write(fig.to_html(**html_options))
+        else:
+            fig.write_html(filepath, **html_options)
+        self._written[(filename, compress)] = (fig, filepath)
         print(f"Plot saved to {filepath}")
+        return filepath
+
+    def _report_figures(self):
+        return {
+            'temperature_trend': self.plot_global_temperature_trend,
+            'monthly_trends': self.plot_monthly_trends,
+            'decadal_changes': self.calculate_decadal_changes,
+        }
+
+    def export_report(self, filename='report.html'):
+        """Write every figure into one HTML page that loads plotly.js once."""
+        from plotly.offline import get_plotlyjs_version
+        divs = []
+        for name, build in self._report_figures().items():
+            fig = build()
+            if fig is not None:
+                divs.append(fig.to_html(include_plotlyjs=False, full_html=False, div_id=name,
+                                        validate=False, config={'responsive': True}))
+
+        filepath = os.path.join(_ensure_dir(OUTPUT_DIR), filename)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write('<html>\n<head>\n<meta charset="utf-8" />\n')
+            f.write(f'<title>Climate Analysis ({self.dataset_type})</title>\n')
+            f.write(f'<script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"></script>\n')
+            f.write('</head>\n<body>\n')
+            f.write('\n'.join(divs))
+            f.write('\n</body>\n</html>\n')
+        print(f"Report saved to {filepath}")
+        return filepath
 
     def load_sea_ice_data(self, path='data/N_Sea_Ice_Index_Regional_Monthly_Data_G02135_v3.0.xlsx'):
         """Load and preview the sea ice dataset for integration."""
@@ -311,6 +552,7 @@ class ClimateAnalysis:
 
     def plot_sea_ice_trends(self, path='data/N_Sea_Ice_Index_Regional_Monthly_Data_G02135_v3.0.xlsx'):
         """Process and plot annual average sea ice area over time."""
+        import matplotlib.pyplot as plt
         df = pd.read_excel(path, header=2)  # Use third row as header
         df.columns = [str(col).strip() for col in df.columns]
         months = ['January', 'February', 'March', 'April', 'May', 'June',
@@ -338,51 +580,36 @@ class ClimateAnalysis:
         plt.show()
         return df
 
+_shared = None
+_shared_lock = threading.Lock()
+
+def get_climate_analysis(data_path='data/GLB.Ts+dSST.csv'):
+    """Return the process-wide ClimateAnalysis for data_path, loading it on first use."""
+    global _shared
+    with _shared_lock:
+        if _shared is None or _shared.data_path != data_path:
+            _shared = ClimateAnalysis(data_path)
+        return _shared
+
 if __name__ == "__main__":
     # Initialize analysis
-    analysis = ClimateAnalysis()
+    analysis = get_climate_analysis()
     
     # Create output directory if it doesn't exist
-    os.makedirs('outputs', exist_ok=True)
+    _ensure_dir(OUTPUT_DIR)
     
-    # Generate and save visualizations
-    temp_trend = analysis.plot_global_temperature_trend()
-    if temp_trend:
-        analysis.save_plot(temp_trend, "temperature_trend.html")
-    
-    monthly_trends = analysis.plot_monthly_trends()
-    if monthly_trends:
-        analysis.save_plot(monthly_trends, "monthly_trends.html")
-    
-    decadal_changes = analysis.calculate_decadal_changes()
-    if decadal_changes:
-        analysis.save_plot(decadal_changes, "decadal_changes.html")
+    # Generate and save visualizations as a single report page
+    analysis.export_report()
     
     # Calculate and save statistics
     stats = analysis.calculate_statistics()
-    with open('outputs/statistics.txt', 'w') as f:
-        f.write("Climate Analysis Statistics\n")
-        f.write("=========================\n\n")
-        f.write(f"Dataset: {analysis.dataset_type}\n")
-        f.write(f"Year Range: {analysis.df['Year'].min()} - {analysis.df['Year'].max()}\n\n")
-        
-        f.write("Extreme Values:\n")
-        f.write(f"Warmest Year: {stats['extremes']['warmest_year']} ({stats['extremes']['warmest_temp']:.3f}°C)\n")
-        f.write(f"Coldest Year: {stats['extremes']['coldest_year']} ({stats['extremes']['coldest_temp']:.3f}°C)\n\n")
-        
-        f.write("Temperature Trends:\n")
-        f.write(f"Linear Trend: {stats['trends']['linear_trend']:.4f}°C/year\n")
-        f.write(f"Quadratic Trend: {stats['trends']['quadratic_trend']:.4f}°C/year²\n")
-        f.write(f"10-Year Rolling Standard Deviation: {stats['trends']['rolling_std']:.4f}°C\n\n")
-        
-        f.write("Seasonal Trends (°C/year):\n")
-        for season, trend in stats['seasonal_trends'].items():
-            f.write(f"{season}: {trend:.4f}\n")
-        
-        f.write("\nTemperature Variability:\n")
-        f.write(f"Annual Standard Deviation: {stats['variability']['annual_std']:.4f}°C\n")
-        f.write(f"Monthly Standard Deviation: {stats['variability']['monthly_std']:.4f}°C\n")
-        f.write(f"Seasonal Standard Deviation: {stats['variability']['seasonal_std']:.4f}°C\n")
+    with open(os.path.join(OUTPUT_DIR, 'statistics.txt'), 'w') as f:
+        f.write(STATS_TEMPLATE.format(
+            dataset=analysis.dataset_type,
+            start=analysis.years.min(), end=analysis.years.max(),
+            seasonal='\n'.join(f"{season}: {trend:.4f}" for season, trend in stats['seasonal_trends'].items()),
+            **stats['extremes'], **stats['trends'], **stats['variability'],
+        ))
 
     # Load and preview sea ice data
     sea_ice_df = analysis.load_sea_ice_data() 
\ No newline at end of file
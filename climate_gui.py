@@ -1,12 +1,8 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from tkinter import ttk, messagebox, scrolledtext, filedialog
 import numpy as np
-from climate_analysis import ClimateAnalysis
-from matplotlib.animation import FuncAnimation
-import matplotlib as mpl
-import pandas as pd
+import threading
+import math
 
 # --- BOLD COLOR PALETTE ---
 COLORS = {
@@ -27,6 +23,126 @@ COLORS = {
     'plant_green': '#32CD32',
 }
 
+SEA_ICE_PATH = 'data/N_Sea_Ice_Index_Regional_Monthly_Data_G02135_v3.0.xlsx'
+
+# Long-form explanations for the info buttons (as long and narrative as possible)
+EXPLANATIONS = {
+    "temperature": (
+        "Temperature Trends Analysis: The Pulse of a Warming Planet\n\n"
+        "This graph is more than a line on a chart—it's the heartbeat of our changing world. The blue line traces annual temperature variations, the red dashed line reveals the relentless march of the long-term trend, and the green line smooths out the noise to show the underlying direction.\n\n"
+        "Why This Matters:\n"
+        "Since the dawn of the industrial era, human activity has released vast amounts of greenhouse gases, trapping heat in the atmosphere. The result? A planet that is warming at a rate unprecedented in recorded history. This graph is a visual record of that transformation.\n\n"
+        "The Science Behind the Curve:\n"
+        "• Each data point represents a year of global temperature anomaly—how much warmer or cooler it was compared to a 20th-century baseline.\n"
+        "• The red trend line is calculated using linear regression, showing the average rate of change over time.\n"
+        "• The green moving average helps us see past short-term fluctuations caused by volcanic eruptions, El Niño events, or solar cycles.\n\n"
+        "Key Findings:\n"
+        "• The last decade was the hottest on record, with 8 of the 10 warmest years occurring since 2010.\n"
+        "• The rate of warming has doubled since the 1970s, now exceeding 0.2°C per decade.\n"
+        "• Temperature extremes are becoming more frequent, with new records set almost every year.\n"
+        "• The 10-year moving average shows a persistent upward trend, far beyond natural variability.\n"
+        "• The curve is steepening—a sign that we are approaching critical climate tipping points.\n\n"
+        "Real-World Impact:\n"
+        "This isn't just about numbers. Rising temperatures are melting glaciers, raising sea levels, and fueling more intense heatwaves, droughts, and wildfires. Crop yields are threatened, water supplies are strained, and the risk of deadly heat stress is rising for millions.\n\n"
+        "Case Study: The 2023 European Heatwave\n"
+        "In 2023, Europe experienced its hottest summer ever recorded. Crops withered, rivers ran dry, and power grids were pushed to the brink. This is the new normal unless we act.\n\n"
+        "Looking Forward:\n"
+        "Every fraction of a degree matters. Limiting warming to 1.5°C could prevent the worst impacts, but we're already on track to exceed that threshold within the next two decades. The choices we make now—cutting emissions, investing in clean energy, and building resilience—will shape the future of life on Earth."
+    ),
+    "monthly": (
+        "Monthly Temperature Patterns: The Rhythm of a Changing Year\n\n"
+        "This heatmap is a tapestry of color, revealing how the familiar rhythm of the seasons is being rewritten by climate change.\n\n"
+        "What You See:\n"
+        "• Each row is a month, each column a year.\n"
+        "• Red shades signal months that were warmer than average; blue shades show cooler months.\n"
+        "• Vertical stripes reveal seasonal cycles; horizontal bands show long-term trends.\n\n"
+        "Why This Matters:\n"
+        "The natural calendar that has guided agriculture, migration, and human activity for millennia is shifting. Winters are shrinking, springs are arriving earlier, and heat waves are striking sooner and with greater intensity.\n\n"
+        "Key Insights:\n"
+        "• Winter months (December–February) are warming faster than summer months, disrupting snowpack, water supplies, and natural cycles.\n"
+        "• Shoulder seasons—spring and fall—are showing increased instability, with wild swings between warm and cold.\n"
+        "• Heat waves are not only more intense but are occurring earlier in the year, catching communities off guard.\n"
+        "• The pattern of warming is not uniform: some regions experience cold snaps even as the global average rises, a hallmark of climate disruption.\n\n"
+        "Real-World Impact:\n"
+        "Farmers are struggling to adapt to unpredictable frost dates and growing seasons. Wildlife migration and breeding are thrown out of sync. Cities face new challenges in managing energy demand as air conditioning use spikes earlier and longer each year.\n\n"
+        "Case Study: Early Cherry Blossoms in Japan\n"
+        "In recent years, cherry blossoms in Kyoto have peaked weeks earlier than historical averages—a vivid sign of how climate change is altering the natural world.\n\n"
+        "What This Means for the Future:\n"
+        "Adapting to these changes will require new strategies for agriculture, urban planning, and disaster preparedness. The heatmap is a warning—and a guide—for what lies ahead."
+    ),
+    "seasonal": (
+        "Seasonal Temperature Analysis: Four Seasons, One Warming World\n\n"
+        "This set of plots breaks down temperature changes by season, revealing the uneven pace of warming throughout the year.\n\n"
+        "What the Graph Shows:\n"
+        "• DJF: Winter (December–February)\n"
+        "• MAM: Spring (March–May)\n"
+        "• JJA: Summer (June–August)\n"
+        "• SON: Fall (September–November)\n\n"
+        "Why This Matters:\n"
+        "Seasonal shifts are more than a curiosity—they are a fundamental reshaping of the world we know. Winters are losing their chill, springs are less predictable, and summers are pushing the limits of human and ecological endurance.\n\n"
+        "Key Findings:\n"
+        "• Winters are warming at nearly twice the rate of summers, reducing snowpack and threatening water supplies for millions.\n"
+        "• Spring temperatures are increasingly erratic, disrupting pollination, plant growth, and animal migration.\n"
+        "• Summer heat extremes are intensifying, leading to more frequent and severe heatwaves, wildfires, and health emergencies.\n"
+        "• Autumns are lingering longer, delaying the onset of winter and altering the timing of ecological events.\n"
+        "• The uneven pace of warming is a sign of deep disruption in the climate system.\n\n"
+        "Real-World Impact:\n"
+        "Earlier springs mean earlier allergies and mismatched timing for crops and pollinators. Hotter summers strain power grids and public health. Shorter, milder winters fail to control pests and diseases.\n\n"
+        "Case Study: The Disappearing Snowpack in the Western US\n"
+        "In the western United States, shrinking winter snowpack is reducing water availability for cities and farms, increasing wildfire risk, and threatening entire ecosystems.\n\n"
+        "What's at Stake:\n"
+        "Understanding seasonal trends is essential for planning everything from agriculture to disaster response. The four seasons are changing—our strategies must change with them."
+    ),
+    "decadal": (
+        "Decadal Temperature Changes: The Long View\n\n"
+        "This bar chart zooms out to reveal the big picture: how each decade stacks up against the last.\n\n"
+        "What the Graph Shows:\n"
+        "• Blue bars: Temperature difference between consecutive decades\n"
+        "• Positive values: Warming trends\n"
+        "• Negative values: Cooling trends (now rare)\n\n"
+        "Why This Matters:\n"
+        "Decadal analysis cuts through the noise of year-to-year variability, exposing the relentless upward march of global temperatures. Each new decade sets a higher baseline, making adaptation more urgent.\n\n"
+        "Key Insights:\n"
+        "• The last four decades have each been successively warmer than any previous decade on record.\n"
+        "• The rate of warming between decades is accelerating, with the 2010s and 2020s showing the largest jumps.\n"
+        "• Natural cooling periods, once common, are now rare and less intense.\n"
+        "• The decadal trend line is a stark warning: the climate system is shifting to a new, hotter normal.\n\n"
+        "Real-World Impact:\n"
+        "These changes are not abstract. They affect food security, water resources, and the stability of societies.\n\n"
+        "Case Study: The Disappearing Arctic Ice Decade by Decade\n"
+        "Satellite data show that each decade since the 1980s has seen less Arctic sea ice than the last, with profound consequences for global weather and ocean currents.\n\n"
+        "What the Future Holds:\n"
+        "If current trends continue, future decades will bring even greater challenges. Decadal data is a call to action for long-term planning and bold climate policy."
+    ),
+    "sea_ice": (
+        "Sea Ice Trends: The Arctic's Alarming Retreat\n\n"
+        "This graph is a window into the frozen heart of our planet. It tracks the annual average sea ice area in the Northern Hemisphere—a vital sign of planetary health.\n\n"
+        "Why Sea Ice Matters:\n"
+        "Sea ice is a powerful regulator of Earth's climate. Its bright surface reflects sunlight, keeping the Arctic cool and moderating global temperatures (the albedo effect). As sea ice vanishes, darker ocean water absorbs more heat, creating a feedback loop that accelerates warming.\n\n"
+        "But sea ice is more than a climate thermostat. It's the foundation of polar ecosystems, supporting everything from plankton to polar bears. It shapes weather patterns across the Northern Hemisphere, influences ocean currents, and even affects rainfall thousands of miles away.\n\n"
+        "Key Findings:\n"
+        "• The Arctic has lost over 40% of its summer sea ice extent since satellite records began in 1979.\n"
+        "• The minimum annual average sea ice area has dropped to record lows, with the last decade seeing the lowest extents ever measured.\n"
+        "• The rate of decline is accelerating: the Arctic is warming nearly four times faster than the global average.\n"
+        "• Multi-year ice (thicker, older ice) is disappearing, replaced by thin, seasonal ice that melts more easily.\n"
+        "• Unusual events—like mid-winter melt episodes and record-low refreezing—are becoming more common.\n"
+        "• Decadal averages show a relentless downward trend, with each decade losing more ice than the last.\n"
+        "• Record low years are clustered in the 21st century, a sign of rapid change.\n"
+        "• The loss of sea ice is not just a symptom but a driver of further climate disruption.\n\n"
+        "The Science and the Stakes:\n"
+        "• Sea ice loss amplifies global warming, disrupts ocean circulation, and can trigger extreme weather far from the poles.\n"
+        "• Melting sea ice releases methane from the Arctic seabed, a potent greenhouse gas that could accelerate warming.\n"
+        "• Indigenous communities who rely on sea ice for travel, hunting, and culture face existential threats.\n"
+        "• The loss of habitat endangers iconic species and reduces the planet's ability to reflect solar energy.\n\n"
+        "Case Study: The 2012 Arctic Sea Ice Collapse\n"
+        "In September 2012, Arctic sea ice reached its lowest extent ever recorded—less than half the average of the 1980s. Scientists warn that ice-free Arctic summers could occur within decades, with unknown consequences for global climate stability.\n\n"
+        "What the Future Holds:\n"
+        "If current trends continue, the Arctic could become seasonally ice-free by mid-century. This would reshape weather, ocean currents, and ecosystems worldwide.\n\n"
+        "A Call to Action:\n"
+        "Protecting sea ice means protecting the planet. Rapid emissions cuts, investment in renewable energy, and support for Arctic communities are essential to slow the retreat and safeguard our shared future."
+    )
+}
+
 try:
     MAIN_FONT = ('Poppins', 14)
     HEADER_FONT = ('Poppins', 38, 'bold')
@@ -36,60 +152,82 @@ except:
     HEADER_FONT = ('Helvetica Neue', 38, 'bold')
     SUBHEADER_FONT = ('Helvetica Neue', 20, 'bold')
 
-class CustomToolbar(NavigationToolbar2Tk):
-    def __init__(self, canvas, parent):
-        super().__init__(canvas, parent)
-        self.config(background='#2c3e50')
-        for button in self.winfo_children():
-            if isinstance(button, tk.Button):
-                button.configure(background='#34495e', foreground='white',
-                               activebackground='#3498db', activeforeground='white')
+class BlitManager:
+    """Redraws a few animated artists over a cached copy of the rest of the figure."""
+    def __init__(self, canvas, artists):
+        self.canvas = canvas
+        self.artists = list(artists)
+        self._bg = None
+        for artist in self.artists:
+            artist.set_animated(True)
+        # Every full draw (first paint, resize, toolbar zoom) refreshes the background
+        self._cid = canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        self._bg = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        for artist in self.artists:
+            self.canvas.figure.draw_artist(artist)
+
+    def update(self):
+        if self._bg is None:
+            return  # the first full draw will paint the artists
+        self.canvas.restore_region(self._bg)
+        self._draw_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def disconnect(self):
+        self.canvas.mpl_disconnect(self._cid)
 
 class RoundedButton(tk.Canvas):
     default_bg = '#2c3e50'
     default_fg = 'white'
     default_hover = '#3498db'
+    # Rounded-rectangle images shared by all buttons, keyed by (width, height, radius, color)
+    _bg_cache = {}
 
     def __init__(self, parent, text, command=None, width=120, height=35, corner_radius=10, bg='#34495e', fg='white', hover_color='#3498db', **kwargs):
         super().__init__(parent, width=width, height=height, highlightthickness=0, bg='#2c3e50', **kwargs)
         self.command = command
         self.bg = bg
         self.hover_color = hover_color
-        self.rect = self.create_rounded_rect(0, 0, width, height, corner_radius, fill=bg)
+        # State changes swap which image the one canvas item shows
+        self.images = {state: self.rounded_image(width, height, corner_radius, color)
+                       for state, color in (('normal', bg), ('hover', hover_color), ('pressed', '#2980b9'))}
+        self.rect = self.create_image(0, 0, anchor='nw', image=self.images['normal'])
         self.text = self.create_text(width/2, height/2, text=text, fill=fg, font=('Helvetica', 10, 'normal'))
         self.bind('<Enter>', self.on_enter)
         self.bind('<Leave>', self.on_leave)
         self.bind('<Button-1>', self.on_click)
         self.bind('<ButtonRelease-1>', self.on_release)
 
-    def create_rounded_rect(self, x1, y1, x2, y2, radius, **kwargs):
-        points = [
-            x1+radius, y1,
-            x2-radius, y1,
-            x2, y1,
-            x2, y1+radius,
-            x2, y2-radius,
-            x2, y2,
-            x2-radius, y2,
-            x1+radius, y2,
-            x1, y2,
-            x1, y2-radius,
-            x1, y1+radius,
-            x1, y1
-        ]
-        return self.create_polygon(points, smooth=True, **kwargs)
+    @classmethod
+    def rounded_image(cls, width, height, radius, color):
+        key = (width, height, radius, color)
+        if key not in cls._bg_cache:
+            # Filled one row at a time; pixels outside the corner arcs stay transparent
+            image = tk.PhotoImage(width=width, height=height)
+            for y in range(height):
+                dy = max(radius - y - 0.5, y + 0.5 - (height - radius), 0)
+                inset = int(round(radius - math.sqrt(max(radius * radius - dy * dy, 0)))) if dy else 0
+                if width - inset > inset:
+                    image.put(color, to=(inset, y, width - inset, y + 1))
+            cls._bg_cache[key] = image
+        return cls._bg_cache[key]
 
     def on_enter(self, e):
-        self.itemconfig(self.rect, fill=self.hover_color)
+        self.itemconfig(self.rect, image=self.images['hover'])
 
     def on_leave(self, e):
-        self.itemconfig(self.rect, fill=self.bg)
+        self.itemconfig(self.rect, image=self.images['normal'])
 
     def on_click(self, e):
-        self.itemconfig(self.rect, fill='#2980b9')
+        self.itemconfig(self.rect, image=self.images['pressed'])
 
     def on_release(self, e):
-        self.itemconfig(self.rect, fill=self.hover_color)
+        self.itemconfig(self.rect, image=self.images['hover'])
         if self.command:
             self.command()
 
@@ -154,6 +292,7 @@ class ClimateGUI:
         self.main_frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=8)
         # --- Control panel ---
         self.temp_unit = tk.StringVar(value='Celsius')
+        self._drawn_unit = None
         self.create_control_panel()
         # --- BUTTON BAR ---
         self.button_frame = tk.Frame(self.main_frame, bg=self.colors['panel'], bd=0)
@@ -180,6 +319,8 @@ class ClimateGUI:
                 cursor='hand2'
             )
             btn.pack(side=tk.LEFT, padx=6, pady=4)
+            # Enabled by _show_when_loaded once there is something to plot
+            btn.config(state=tk.DISABLED)
             self.button_widgets[cmd] = btn
             if cmd != "stats":
                 info_btn = tk.Button(
@@ -194,23 +335,30 @@ class ClimateGUI:
         # --- PLOT FRAME ---
         self.plot_frame = tk.Frame(self.main_frame, bg=self.colors['panel'], bd=2, relief='ridge')
         self.plot_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-        plt.style.use('dark_background')
-        mpl.rcParams['axes.facecolor'] = self.colors['plot_bg']
-        mpl.rcParams['figure.facecolor'] = self.colors['panel']
-        mpl.rcParams['savefig.facecolor'] = self.colors['panel']
-        mpl.rcParams['axes.edgecolor'] = self.colors['accent']
-        mpl.rcParams['xtick.color'] = self.colors['subtle']
-        mpl.rcParams['ytick.color'] = self.colors['subtle']
-        mpl.rcParams['text.color'] = self.colors['text']
-        mpl.rcParams['axes.labelcolor'] = self.colors['accent']
-        mpl.rcParams['axes.titlecolor'] = self.colors['accent']
-        self.fig = plt.figure(figsize=(11, 7), facecolor=self.colors['panel'])
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        # --- RESTORE MATPLOTLIB TOOLBAR ---
-        self.toolbar = NavigationToolbar2Tk(self.canvas, self.plot_frame)
-        self.toolbar.config(bg=self.colors['panel'])
-        self.toolbar.update()
+        # Applied with rc_context wherever artists are built, instead of
+        # plt.style.use, so the global rcParams stay untouched
+        self._rc = {
+            'axes.facecolor': self.colors['plot_bg'],
+            'figure.facecolor': self.colors['panel'],
+            'figure.edgecolor': self.colors['panel'],
+            'savefig.facecolor': self.colors['panel'],
+            'axes.edgecolor': self.colors['accent'],
+            'xtick.color': self.colors['subtle'],
+            'ytick.color': self.colors['subtle'],
+            'text.color': self.colors['text'],
+            'axes.labelcolor': self.colors['accent'],
+            'axes.titlecolor': self.colors['accent'],
+            'lines.color': self.colors['text'],
+            'patch.edgecolor': self.colors['text'],
+            'grid.color': self.colors['plot_grid'],
+            # Lines are at most a few thousand points (_plot_decimated thins
+            # longer ones), so simplifying or chunking paths is pure overhead
+            'path.simplify': False,
+            'agg.path.chunksize': 0,
+        }
+        # Figure, canvas and toolbar are built once matplotlib has loaded
+        # off the UI thread; see _build_canvas
+        self.fig = self.canvas = self.toolbar = None
         # --- TEXT WIDGET ---
         self.text_widget = scrolledtext.ScrolledText(
             self.plot_frame,
@@ -224,8 +372,47 @@ class ClimateGUI:
             bd=0,
             highlightthickness=0
         )
-        self.analysis = ClimateAnalysis()
-        self.show_plot("temperature")
+        self.text_widget.tag_configure('title', font=('Segoe UI', 16, 'bold'), foreground=self.colors['accent'], spacing1=10, spacing3=5)
+        self.text_widget.tag_configure('header', font=('Segoe UI', 12, 'bold'), foreground=self.colors['plot_line1'], spacing1=5, spacing3=3)
+        self.text_widget.tag_configure('subheader', font=('Segoe UI', 11, 'bold'), foreground=self.colors['plot_line2'], spacing1=3, spacing3=2)
+        self.text_widget.tag_configure('value', font=('Segoe UI', 10), foreground=self.colors['text'], spacing1=2)
+        self.text_widget.tag_configure('impact', font=('Segoe UI', 10, 'italic'), foreground=self.colors['plot_line4'], spacing1=2)
+        self.text_widget.tag_configure('alert', font=('Segoe UI', 10, 'bold'), foreground=self.colors['plot_line1'], spacing1=2)
+        # --- PLOT DISPATCH ---
+        self._plot_funcs = {
+            "temperature": self.plot_temperature_trends,
+            "monthly": self.plot_monthly_trends,
+            "seasonal": self.plot_seasonal_analysis,
+            "decadal": self.plot_decadal_changes,
+            "sea_ice": self.plot_sea_ice_trends,
+        }
+        # Views that can take new data in place instead of being rebuilt
+        self._update_funcs = {
+            "seasonal": self._update_seasonal_view,
+        }
+        # Axes of each plot type stay on the figure and are shown/hidden on
+        # switch; None means the figure holds something else (an animation)
+        self._views = None
+        self._hover_funcs = {}
+        self._pending_hover = None
+        self._hover_bg = None
+        self._hover_annot = None
+        self._hover_table = None
+        # Pixels of each view's last full draw, as (view key, region)
+        self._view_pixels = {}
+        self._stats_key = None
+        self._full_data = {}
+        self._seasonal_title = None
+        self._season_lines = []
+        self._sea_ice = {}
+        self.anim = None
+        self._anim_after = None
+        # --- DATA (loaded off the UI thread so the window paints first) ---
+        self._analysis = None
+        self._load_error = None
+        self._analysis_thread = threading.Thread(target=self._load_analysis, daemon=True)
+        self._analysis_thread.start()
+        self.root.after(50, self._show_when_loaded)
         
         # Update button colors in RoundedButton and InfoButton
         RoundedButton.default_bg = self.colors['button']
@@ -235,124 +422,66 @@ class ClimateGUI:
         InfoButton.default_fg = self.colors['button_fg']
         InfoButton.default_hover = self.colors['button_active']
     
-        # Add detailed, long-form explanations for info buttons (as long and narrative as possible)
-        self.explanations = {
-            "temperature": (
-                "Temperature Trends Analysis: The Pulse of a Warming Planet\n\n"
-                "This graph is more than a line on a chart—it's the heartbeat of our changing world. The blue line traces annual temperature variations, the red dashed line reveals the relentless march of the long-term trend, and the green line smooths out the noise to show the underlying direction.\n\n"
-                "Why This Matters:\n"
-                "Since the dawn of the industrial era, human activity has released vast amounts of greenhouse gases, trapping heat in the atmosphere. The result? A planet that is warming at a rate unprecedented in recorded history. This graph is a visual record of that transformation.\n\n"
-                "The Science Behind the Curve:\n"
-                "• Each data point represents a year of global temperature anomaly—how much warmer or cooler it was compared to a 20th-century baseline.\n"
-                "• The red trend line is calculated using linear regression, showing the average rate of change over time.\n"
-                "• The green moving average helps us see past short-term fluctuations caused by volcanic eruptions, El Niño events, or solar cycles.\n\n"
-                "Key Findings:\n"
-                "• The last decade was the hottest on record, with 8 of the 10 warmest years occurring since 2010.\n"
-                "• The rate of warming has doubled since the 1970s, now exceeding 0.2°C per decade.\n"
-                "• Temperature extremes are becoming more frequent, with new records set almost every year.\n"
-                "• The 10-year moving average shows a persistent upward trend, far beyond natural variability.\n"
-                "• The curve is steepening—a sign that we are approaching critical climate tipping points.\n\n"
-                "Real-World Impact:\n"
-                "This isn't just about numbers. Rising temperatures are melting glaciers, raising sea levels, and fueling more intense heatwaves, droughts, and wildfires. Crop yields are threatened, water supplies are strained, and the risk of deadly heat stress is rising for millions.\n\n"
-                "Case Study: The 2023 European Heatwave\n"
-                "In 2023, Europe experienced its hottest summer ever recorded. Crops withered, rivers ran dry, and power grids were pushed to the brink. This is the new normal unless we act.\n\n"
-                "Looking Forward:\n"
-                "Every fraction of a degree matters. Limiting warming to 1.5°C could prevent the worst impacts, but we're already on track to exceed that threshold within the next two decades. The choices we make now—cutting emissions, investing in clean energy, and building resilience—will shape the future of life on Earth."
-            ),
-            "monthly": (
-                "Monthly Temperature Patterns: The Rhythm of a Changing Year\n\n"
-                "This heatmap is a tapestry of color, revealing how the familiar rhythm of the seasons is being rewritten by climate change.\n\n"
-                "What You See:\n"
-                "• Each row is a month, each column a year.\n"
-                "• Red shades signal months that were warmer than average; blue shades show cooler months.\n"
-                "• Vertical stripes reveal seasonal cycles; horizontal bands show long-term trends.\n\n"
-                "Why This Matters:\n"
-                "The natural calendar that has guided agriculture, migration, and human activity for millennia is shifting. Winters are shrinking, springs are arriving earlier, and heat waves are striking sooner and with greater intensity.\n\n"
-                "Key Insights:\n"
-                "• Winter months (December–February) are warming faster than summer months, disrupting snowpack, water supplies, and natural cycles.\n"
-                "• Shoulder seasons—spring and fall—are showing increased instability, with wild swings between warm and cold.\n"
-                "• Heat waves are not only more intense but are occurring earlier in the year, catching communities off guard.\n"
-                "• The pattern of warming is not uniform: some regions experience cold snaps even as the global average rises, a hallmark of climate disruption.\n\n"
-                "Real-World Impact:\n"
-                "Farmers are struggling to adapt to unpredictable frost dates and growing seasons. Wildlife migration and breeding are thrown out of sync. Cities face new challenges in managing energy demand as air conditioning use spikes earlier and longer each year.\n\n"
-                "Case Study: Early Cherry Blossoms in Japan\n"
-                "In recent years, cherry blossoms in Kyoto have peaked weeks earlier than historical averages—a vivid sign of how climate change is altering the natural world.\n\n"
-                "What This Means for the Future:\n"
-                "Adapting to these changes will require new strategies for agriculture, urban planning, and disaster preparedness. The heatmap is a warning—and a guide—for what lies ahead."
-            ),
-            "seasonal": (
-                "Seasonal Temperature Analysis: Four Seasons, One Warming World\n\n"
-                "This set of plots breaks down temperature changes by season, revealing the uneven pace of warming throughout the year.\n\n"
-                "What the Graph Shows:\n"
-                "• DJF: Winter (December–February)\n"
-                "• MAM: Spring (March–May)\n"
-                "• JJA: Summer (June–August)\n"
-                "• SON: Fall (September–November)\n\n"
-                "Why This Matters:\n"
-                "Seasonal shifts are more than a curiosity—they are a fundamental reshaping of the world we know. Winters are losing their chill, springs are less predictable, and summers are pushing the limits of human and ecological endurance.\n\n"
-                "Key Findings:\n"
-                "• Winters are warming at nearly twice the rate of summers, reducing snowpack and threatening water supplies for millions.\n"
-                "• Spring temperatures are increasingly erratic, disrupting pollination, plant growth, and animal migration.\n"
-                "• Summer heat extremes are intensifying, leading to more frequent and severe heatwaves, wildfires, and health emergencies.\n"
-                "• Autumns are lingering longer, delaying the onset of winter and altering the timing of ecological events.\n"
-                "• The uneven pace of warming is a sign of deep disruption in the climate system.\n\n"
-                "Real-World Impact:\n"
-                "Earlier springs mean earlier allergies and mismatched timing for crops and pollinators. Hotter summers strain power grids and public health. Shorter, milder winters fail to control pests and diseases.\n\n"
-                "Case Study: The Disappearing Snowpack in the Western US\n"
-                "In the western United States, shrinking winter snowpack is reducing water availability for cities and farms, increasing wildfire risk, and threatening entire ecosystems.\n\n"
-                "What's at Stake:\n"
-                "Understanding seasonal trends is essential for planning everything from agriculture to disaster response. The four seasons are changing—our strategies must change with them."
-            ),
-            "decadal": (
-                "Decadal Temperature Changes: The Long View\n\n"
-                "This bar chart zooms out to reveal the big picture: how each decade stacks up against the last.\n\n"
-                "What the Graph Shows:\n"
-                "• Blue bars: Temperature difference between consecutive decades\n"
-                "• Positive values: Warming trends\n"
-                "• Negative values: Cooling trends (now rare)\n\n"
-                "Why This Matters:\n"
-                "Decadal analysis cuts through the noise of year-to-year variability, exposing the relentless upward march of global temperatures. Each new decade sets a higher baseline, making adaptation more urgent.\n\n"
-                "Key Insights:\n"
-                "• The last four decades have each been successively warmer than any previous decade on record.\n"
-                "• The rate of warming between decades is accelerating, with the 2010s and 2020s showing the largest jumps.\n"
-                "• Natural cooling periods, once common, are now rare and less intense.\n"
-                "• The decadal trend line is a stark warning: the climate system is shifting to a new, hotter normal.\n\n"
-                "Real-World Impact:\n"
-                "These changes are not abstract. They affect food security, water resources, and the stability of societies.\n\n"
-                "Case Study: The Disappearing Arctic Ice Decade by Decade\n"
-                "Satellite data show that each decade since the 1980s has seen less Arctic sea ice than the last, with profound consequences for global weather and ocean currents.\n\n"
-                "What the Future Holds:\n"
-                "If current trends continue, future decades will bring even greater challenges. Decadal data is a call to action for long-term planning and bold climate policy."
-            ),
-            "sea_ice": (
-                "Sea Ice Trends: The Arctic's Alarming Retreat\n\n"
-                "This graph is a window into the frozen heart of our planet. It tracks the annual average sea ice area in the Northern Hemisphere—a vital sign of planetary health.\n\n"
-                "Why Sea Ice Matters:\n"
-                "Sea ice is a powerful regulator of Earth's climate. Its bright surface reflects sunlight, keeping the Arctic cool and moderating global temperatures (the albedo effect). As sea ice vanishes, darker ocean water absorbs more heat, creating a feedback loop that accelerates warming.\n\n"
-                "But sea ice is more than a climate thermostat. It's the foundation of polar ecosystems, supporting everything from plankton to polar bears. It shapes weather patterns across the Northern Hemisphere, influences ocean currents, and even affects rainfall thousands of miles away.\n\n"
-                "Key Findings:\n"
-                "• The Arctic has lost over 40% of its summer sea ice extent since satellite records began in 1979.\n"
-                "• The minimum annual average sea ice area has dropped to record lows, with the last decade seeing the lowest extents ever measured.\n"
-                "• The rate of decline is accelerating: the Arctic is warming nearly four times faster than the global average.\n"
-                "• Multi-year ice (thicker, older ice) is disappearing, replaced by thin, seasonal ice that melts more easily.\n"
-                "• Unusual events—like mid-winter melt episodes and record-low refreezing—are becoming more common.\n"
-                "• Decadal averages show a relentless downward trend, with each decade losing more ice than the last.\n"
-                "• Record low years are clustered in the 21st century, a sign of rapid change.\n"
-                "• The loss of sea ice is not just a symptom but a driver of further climate disruption.\n\n"
-                "The Science and the Stakes:\n"
-                "• Sea ice loss amplifies global warming, disrupts ocean circulation, and can trigger extreme weather far from the poles.\n"
-                "• Melting sea ice releases methane from the Arctic seabed, a potent greenhouse gas that could accelerate warming.\n"
-                "• Indigenous communities who rely on sea ice for travel, hunting, and culture face existential threats.\n"
-                "• The loss of habitat endangers iconic species and reduces the planet's ability to reflect solar energy.\n\n"
-                "Case Study: The 2012 Arctic Sea Ice Collapse\n"
-                "In September 2012, Arctic sea ice reached its lowest extent ever recorded—less than half the average of the 1980s. Scientists warn that ice-free Arctic summers could occur within decades, with unknown consequences for global climate stability.\n\n"
-                "What the Future Holds:\n"
-                "If current trends continue, the Arctic could become seasonally ice-free by mid-century. This would reshape weather, ocean currents, and ecosystems worldwide.\n\n"
-                "A Call to Action:\n"
-                "Protecting sea ice means protecting the planet. Rapid emissions cuts, investment in renewable energy, and support for Arctic communities are essential to slow the retreat and safeguard our shared future."
-            )
-        }
-    
+    def _load_analysis(self):
+        try:
+            # Imported here so matplotlib and pandas/pyarrow load on this
+            # thread, not before first paint; _build_canvas then finds it loaded
+            import _canvas  # noqa: F401
+            from climate_analysis import get_climate_analysis
+            from _kernels import warm_up
+            self._analysis = get_climate_analysis()
+            # Compile the numba kernels here rather than on the first plot click
+            warm_up()
+            # Resolve the default font now; the first text layout would otherwise do it
+            from matplotlib import font_manager
+            font_manager.findfont(font_manager.FontProperties())
+        except Exception as e:
+            # Tk is not thread-safe; _show_when_loaded reports it on the UI thread
+            self._load_error = e
+
+    @property
+    def analysis(self):
+        # First access waits for the background load started in __init__
+        self._analysis_thread.join()
+        if self._analysis is None:
+            from climate_analysis import get_climate_analysis
+            self._analysis = get_climate_analysis()
+        return self._analysis
+
+    def _show_when_loaded(self):
+        if self._analysis_thread.is_alive():
+            self.root.after(50, self._show_when_loaded)
+        elif self._load_error is not None:
+            messagebox.showerror("Error", f"Error loading climate data: {str(self._load_error)}")
+        else:
+            self._build_canvas()
+            for btn in self.button_widgets.values():
+                btn.config(state=tk.NORMAL)
+            self.show_plot("temperature")
+
+    def _build_canvas(self):
+        import matplotlib as mpl
+        from matplotlib.figure import Figure
+        from _canvas import RcCanvas
+        from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
+        # Screen DPI, clamped so text and line widths stay sane on odd displays
+        dpi = min(max(72, int(self.root.winfo_fpixels('1i'))), 110)
+        # Constrained layout is solved inside each draw; tight_layout would
+        # render the figure once just to measure text before the real draw
+        with mpl.rc_context(self._rc):
+            self.fig = Figure(figsize=(11, 7), dpi=dpi, facecolor=self.colors['panel'],
+                              layout='constrained')
+        self.canvas = RcCanvas(self.fig, self.plot_frame, self._rc)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Hover annotations are blitted over the last full draw
+        self.canvas.mpl_connect('draw_event', self._on_hover_draw)
+        self.canvas.mpl_connect('resize_event', self._on_hover_resize)
+        self.canvas.mpl_connect('motion_notify_event', self._on_motion)
+        # --- RESTORE MATPLOTLIB TOOLBAR ---
+        self.toolbar = NavigationToolbar2Tk(self.canvas, self.plot_frame)
+        self.toolbar.config(bg=self.colors['panel'])
+        self.toolbar.update()
+
     def create_control_panel(self):
         control_frame = ttk.Frame(self.main_frame, style='Button.TFrame')
         control_frame.pack(fill=tk.X, pady=10)
@@ -387,13 +516,21 @@ class ClimateGUI:
         animate_btn.pack(side=tk.RIGHT, padx=10)
         
         self.animate_sea_ice_btn = None
+        self.reset_btn = None
     
     def update_temperature_unit(self):
+        if self.canvas is None:
+            return  # the first plot, once loaded, uses whatever unit is selected
         current_plot = self.current_plot if hasattr(self, 'current_plot') else "temperature"
+        # Re-clicking the selected unit, or any unit on the sea ice view, changes nothing
+        if self.temp_unit.get() == self._drawn_unit or current_plot == "sea_ice":
+            return
         self.show_plot(current_plot)
     
     def export_graph(self):
-        file_path = tk.filedialog.asksaveasfilename(
+        if self.fig is None:
+            return
+        file_path = filedialog.asksaveasfilename(
             defaultextension=".png",
             filetypes=[("PNG files", "*.png"),
                       ("JPEG files", "*.jpg"),
@@ -412,33 +549,33 @@ class ClimateGUI:
         if not hasattr(self, 'current_plot'):
             return
             
-        if hasattr(self, 'reset_btn'):
-            self.reset_btn.destroy()
+        self._reset_figure()
+        
+        import matplotlib as mpl
+        with mpl.rc_context(self._rc):
+            if self.current_plot == "temperature":
+                self.animate_temperature_trends()
+            elif self.current_plot == "monthly":
+                self.animate_monthly_trends()
+            elif self.current_plot == "seasonal":
+                self.animate_seasonal_analysis()
+            elif self.current_plot == "decadal":
+                self.animate_decadal_changes()
+            elif self.current_plot == "sea_ice":
+                self.animate_sea_ice_trends()
             
-        self.fig.clear()
-        
-        if self.current_plot == "temperature":
-            self.animate_temperature_trends()
-        elif self.current_plot == "monthly":
-            self.animate_monthly_trends()
-        elif self.current_plot == "seasonal":
-            self.animate_seasonal_analysis()
-        elif self.current_plot == "decadal":
-            self.animate_decadal_changes()
-        elif self.current_plot == "sea_ice":
-            self.animate_sea_ice_trends()
-            
-        reset_btn = RoundedButton(self.main_frame, text="Reset View",
-                                command=lambda: self.show_plot(self.current_plot))
-        reset_btn.pack(side=tk.TOP, pady=5)
-        self.reset_btn = reset_btn
+        # Built once and only re-packed on later animations
+        if self.reset_btn is None:
+            self.reset_btn = RoundedButton(self.main_frame, text="Reset View",
+                                         command=lambda: self.show_plot(self.current_plot))
+        self.reset_btn.pack(side=tk.TOP, pady=5)
         
     def animate_temperature_trends(self):
         ax = self.fig.add_subplot(111)
         ax.set_facecolor(self.colors['plot_bg'])
         
-        years = self.analysis.df['Year'].values
-        temps = self.analysis.df['annual_temp'].values
+        years = self.analysis.years
+        temps = self.analysis.annual
         
         if self.temp_unit.get() == 'Fahrenheit':
             temps = self.celsius_to_fahrenheit(temps)
@@ -457,15 +594,9 @@ class ClimateGUI:
             spine.set_color(self.colors['plot_line2'])
         
         def animate(frame):
-            if frame > 0:
-                line.set_data(years[:frame], temps[:frame])
-            return [line]
+            line.set_data(years[:frame], temps[:frame])
         
-        self.anim = FuncAnimation(
-            self.fig, animate, frames=len(years) + 1,
-            interval=50, blit=False, repeat=False
-        )
-        self.canvas.draw()
+        self._start_animation([line], animate, len(years))
         
     def animate_seasonal_analysis(self):
         seasons = {
@@ -474,10 +605,10 @@ class ClimateGUI:
             'JJA': 'Summer (Jun-Aug)',
             'SON': 'Autumn (Sep-Nov)'
         }
-        years = self.analysis.df['Year'].values
+        years = self.analysis.years
         
         self.fig.suptitle('Seasonal Temperature Patterns', color=self.colors['accent'], 
-                         y=0.95, font={'size': 14, 'weight': 'bold'})
+                         font={'size': 14, 'weight': 'bold'})
         
         colors = [
             '#FF6B6B',  # Winter (DJF) - red
@@ -486,11 +617,12 @@ class ClimateGUI:
             self.colors['plot_line4']   # Fall (SON) - gold/yellow
         ]
         lines = []
+        series = []
         
         for i, ((season_code, season_name), color) in enumerate(zip(seasons.items(), colors), 1):
             ax = self.fig.add_subplot(2, 2, i)
             ax.set_facecolor(self.colors['plot_bg'])
-            temps = self.analysis.df[season_code].values
+            temps = self.analysis.seasonal[season_code]
             
             if self.temp_unit.get() == 'Fahrenheit':
                 temps = self.celsius_to_fahrenheit(temps)
@@ -499,6 +631,7 @@ class ClimateGUI:
             ax.set_ylim(min(temps) - 0.1, max(temps) + 0.1)
             line, = ax.plot([], [], color=color, linewidth=2)
             lines.append(line)
+            series.append(temps)
             
             ax.set_title(season_name, color=self.colors['accent'])
             ax.set_xlabel('Year', color=self.colors['text'])
@@ -510,19 +643,10 @@ class ClimateGUI:
                 spine.set_color(self.colors['plot_line2'])
         
         def animate(frame):
-            if frame > 0:
-                for i, ((season_code, _), line) in enumerate(zip(seasons.items(), lines)):
-                    temps = self.analysis.df[season_code].values
-                    if self.temp_unit.get() == 'Fahrenheit':
-                        temps = self.celsius_to_fahrenheit(temps)
-                    line.set_data(years[:frame], temps[:frame])
-            return lines
-        
-        self.anim = FuncAnimation(
-            self.fig, animate, frames=len(years) + 1,
-            interval=50, blit=False, repeat=False
-        )
-        self.canvas.draw()
+            for line, temps in zip(lines, series):
+                line.set_data(years[:frame], temps[:frame])
+        
+        self._start_animation(lines, animate, len(years))
         
     def animate_monthly_trends(self):
         ax = self.fig.add_subplot(111)
@@ -530,12 +654,9 @@ class ClimateGUI:
         
         months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        data = self.analysis.df[months].values
-        
-        if self.temp_unit.get() == 'Fahrenheit':
-            data = self.celsius_to_fahrenheit(data)
-            
-        years = self.analysis.df['Year'].values
+        # Always °C, like the static heatmap and its colorbar label
+        data = self.analysis.monthly_image
+        years = self.analysis.years
         
         ax.set_title('Monthly Temperature Patterns', color=self.colors['accent'], pad=20,
                     font={'size': 14, 'weight': 'bold'})
@@ -545,14 +666,20 @@ class ClimateGUI:
         ax.set_yticklabels(months, color=self.colors['text'])
         ax.tick_params(colors=self.colors['text'])
         
-        im = ax.imshow(data.T, aspect='auto', cmap='coolwarm',
-                      extent=[years[0], years[-1], -0.5, 11.5])
+        # Months as rows in a C-contiguous float32 block, transposed once per
+        # dataset, so Agg colormaps it without a copy; origin='lower' puts
+        # Jan at y=0 where its tick label is. The 'rgba' stage applies the
+        # colormap to the 12 x years grid before nearest resampling rather
+        # than to every screen pixel; with 'nearest' the result is identical
+        im = ax.imshow(data, aspect='auto', cmap='coolwarm',
+                      interpolation='nearest', interpolation_stage='rgba',
+                      origin='lower', extent=[years[0], years[-1], -0.5, 11.5])
         
         colorbar = self.fig.colorbar(im, ax=ax)
         colorbar.set_label('Temperature Anomaly (°C)', color=self.colors['accent'], 
                           fontsize=10, labelpad=10)
         colorbar.ax.yaxis.set_tick_params(color=self.colors['text'])
-        plt.setp(colorbar.ax.get_yticklabels(), color=self.colors['text'])
+        colorbar.ax.yaxis.set_tick_params(labelcolor=self.colors['text'])
         
         ax.grid(True, alpha=0.2, color=self.colors['plot_grid'])
         
@@ -565,21 +692,20 @@ class ClimateGUI:
         ax = self.fig.add_subplot(111)
         ax.set_facecolor(self.colors['plot_bg'])
         
-        self.analysis.df['Decade'] = (self.analysis.df['Year'] // 10) * 10
-        decadal_avg = self.analysis.df.groupby('Decade')['annual_temp'].mean()
-        decadal_std = self.analysis.df.groupby('Decade')['annual_temp'].std()
+        decadal = self.analysis.decadal_stats()
+        decades = decadal.index.to_numpy()
+        decadal_avg = decadal['mean'].to_numpy()
+        decadal_std = decadal['std'].to_numpy()
         
         unit_symbol = '°F' if self.temp_unit.get() == 'Fahrenheit' else '°C'
         if self.temp_unit.get() == 'Fahrenheit':
             decadal_avg = self.celsius_to_fahrenheit(decadal_avg)
             decadal_std = decadal_std * 9/5
         
-        decades = decadal_avg.index.values
-        
         ax.set_xlim(decades.min() - 5, decades.max() + 5)
         ax.set_ylim(
-            (decadal_avg - decadal_std).min() - 0.2,
-            (decadal_avg + decadal_std).max() + 0.2
+            np.nanmin(decadal_avg - decadal_std) - 0.2,
+            np.nanmax(decadal_avg + decadal_std) + 0.2
         )
         
         # Plot the data points with error bars
@@ -589,20 +715,19 @@ class ClimateGUI:
         
         # Calculate and plot trend line
         if len(decades) > 1:
-            z = np.polyfit(decades, decadal_avg, 1)
-            p = np.poly1d(z)
-            trend_line, = ax.plot(decades, p(decades), 
+            from _kernels import linear_fit
+            warming_rate, intercept = linear_fit(decades, decadal_avg)
+            trend_line, = ax.plot(decades, self._trend_values(decades, warming_rate, intercept), 
                                 color=self.colors['plot_line2'], linestyle='--', 
                                 linewidth=2, label='Trend')
             
-            warming_rate = z[0]
-            total_change = decadal_avg.iloc[-1] - decadal_avg.iloc[0]
+            total_change = decadal_avg[-1] - decadal_avg[0]
             
             # Add statistics box
             stats_text = (
                 f"Warming Rate: {warming_rate:.4f}{unit_symbol}/decade\n"
                 f"Total Change: {total_change:.2f}{unit_symbol}\n"
-                f"Current Decade: {decadal_avg.iloc[-1]:.2f}{unit_symbol}"
+                f"Current Decade: {decadal_avg[-1]:.2f}{unit_symbol}"
             )
             stats_box = ax.text(0.98, 0.98, stats_text, 
                               transform=ax.transAxes,
@@ -615,9 +740,7 @@ class ClimateGUI:
                                       alpha=0.9))
         
         # Add value labels
-        for x, y in zip(decades, decadal_avg):
-            ax.text(x, y + 0.02, f'{y:.2f}{unit_symbol}',
-                   ha='center', va='bottom', color=self.colors['text'])
+        self._label_points(ax, decades, decadal_avg, unit_symbol)
         
         ax.set_title('Decadal Temperature Changes', color=self.colors['accent'], pad=20,
                     font={'size': 14, 'weight': 'bold'})
@@ -630,75 +753,220 @@ class ClimateGUI:
             spine.set_color(self.colors['plot_line2'])
             
         ax.legend(facecolor=self.colors['panel'], edgecolor=self.colors['plot_line2'], loc='upper left')
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def celsius_to_fahrenheit(self, celsius):
-        return (celsius * 9/5)
+        """Rescale anomalies, slopes or spreads from °C to °F (no +32 offset)."""
+        # One multiply keeps float32 arrays float32 and skips the temporary
+        # that `* 9 / 5` makes
+        return np.multiply(celsius, 1.8)
     
     def animate_plot(self, ax, data, line, xdata, ydata):
         def update(frame):
             line.set_data(xdata[:frame], ydata[:frame])
-            return line,
         
-        anim = FuncAnimation(self.fig, update, frames=len(xdata),
-                           interval=20, blit=True)
-        return anim
+        self._start_animation([line], update, len(xdata), interval=20)
+        return self.anim
+    
+    def _start_animation(self, artists, update, n_frames, interval=50):
+        """Call update(1..n_frames) from Tk timers, blitting only the given artists."""
+        self.anim = BlitManager(self.canvas, artists)
+        
+        def step(frame):
+            update(frame)
+            self.anim.update()
+            self._anim_after = self.root.after(interval, step, frame + 1) if frame < n_frames else None
+        
+        # The full draw caches the static background the frames are blitted onto
+        self.canvas.draw_idle()
+        self._anim_after = self.root.after(interval, step, 1)
     
     def show_explanation(self, plot_type):
-        explanation = self.explanations.get(plot_type, "No explanation available.")
+        explanation = EXPLANATIONS.get(plot_type, "No explanation available.")
         messagebox.showinfo(f"About {plot_type.title()} Graph", explanation)
     
     def show_plot(self, plot_type):
         self.current_plot = plot_type
+        self._drawn_unit = self.temp_unit.get()
+        if self.reset_btn is not None:
+            self.reset_btn.pack_forget()
+        self._stop_animation()
         try:
             if plot_type == "stats":
                 self.canvas.get_tk_widget().pack_forget()
                 self.toolbar.pack_forget()
                 self.show_statistics()
-            elif plot_type == "sea_ice":
-                self.text_widget.pack_forget()
-                self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-                self.toolbar.pack(side=tk.BOTTOM, fill=tk.X)
-                self.fig.clear()
-                self.plot_sea_ice_trends()
             else:
                 self.text_widget.pack_forget()
                 self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
                 self.toolbar.pack(side=tk.BOTTOM, fill=tk.X)
-                self.fig.clear()
-                if plot_type == "temperature":
-                    self.plot_temperature_trends()
-                elif plot_type == "monthly":
-                    self.plot_monthly_trends()
-                elif plot_type == "seasonal":
-                    self.plot_seasonal_analysis()
-                elif plot_type == "decadal":
-                    self.plot_decadal_changes()
-                self.fig.tight_layout()
-                self.canvas.draw()
+                import matplotlib as mpl
+                with mpl.rc_context(self._rc):
+                    self._activate_view(plot_type)
+                if not self._restore_view_pixels(plot_type):
+                    self.canvas.draw_idle()
         except Exception as e:
             messagebox.showerror("Error", f"Error displaying plot: {str(e)}")
     
+    def _stop_animation(self):
+        # A blitting animation would keep restoring its own background over
+        # whatever is drawn next, so it must not outlive its frames
+        if self._anim_after is not None:
+            self.root.after_cancel(self._anim_after)
+            self._anim_after = None
+        if self.anim is not None:
+            self.anim.disconnect()
+            self.anim = None
+
+    def _reset_figure(self):
+        """Clear the figure and forget every cached view."""
+        self._stop_animation()
+        self._hover_funcs = {}
+        self._hover_bg = None
+        self._hover_annot = None
+        self._view_pixels = {}
+        self._full_data = {}
+        self._views = None
+        self._seasonal_title = None
+        self._season_lines = []
+        self.fig.clear()
+
+    def _activate_view(self, plot_type):
+        """Show plot_type's axes, building them on first use, and hide the others."""
+        if self._views is None:
+            self._reset_figure()
+            self._views = {}
+        # The monthly heatmap is always in °C and sea ice is an area, so a
+        # unit change leaves them alone; sea ice does not depend on the dataset
+        unit = None if plot_type in ("monthly", "sea_ice") else self._drawn_unit
+        key = (unit, None if plot_type == "sea_ice" else self.analysis.dataset_type)
+        view = self._views.get(plot_type)
+        if view is not None and view[0] != key and plot_type in self._update_funcs:
+            # New data for the same artists; nothing is rebuilt
+            self._update_funcs[plot_type]()
+            view = (key, view[1])
+            self._views[plot_type] = view
+        elif view is not None and view[0] != key:
+            for ax in view[1]:
+                self._hover_funcs.pop(ax, None)
+                for line in ax.lines:
+                    self._full_data.pop(line, None)
+                ax.remove()
+            view = None
+        for other, (_, axes) in self._views.items():
+            for ax in axes:
+                ax.set_visible(other == plot_type)
+                ax.set_in_layout(other == plot_type)
+        if view is None:
+            before = set(self.fig.axes)
+            self._plot_funcs[plot_type]()
+            self._views[plot_type] = (key, [ax for ax in self.fig.axes if ax not in before])
+        if self._seasonal_title is not None:
+            self._seasonal_title.set_visible(plot_type == "seasonal")
+            self._seasonal_title.set_in_layout(plot_type == "seasonal")
+
+    def _restore_view_pixels(self, plot_type):
+        """Paint plot_type's last full draw back onto the canvas; False if there is none."""
+        cached = self._view_pixels.get(plot_type)
+        if cached is None or cached[0] != self._views[plot_type][0]:
+            return False
+        # Same artists, data and canvas size as when these pixels were drawn,
+        # so copying them back is equivalent to a full redraw
+        self._hover_bg = cached[1]
+        if self._hover_annot is not None:
+            self._hover_annot.set_visible(False)
+        self.canvas.restore_region(self._hover_bg)
+        self.canvas.blit(self.fig.bbox)
+        return True
+
+    def _update_seasonal_view(self):
+        years = self.analysis.years
+        fahrenheit = self.temp_unit.get() == 'Fahrenheit'
+        unit_symbol = '°F' if fahrenheit else '°C'
+        for ax, line, trend, season_code in self._season_lines:
+            temps = self.analysis.seasonal[season_code]
+            slope = self.analysis.linear_trend(season_code)[0]
+            trend_y = self.analysis.trend_line(season_code)
+            if fahrenheit:
+                temps = self.celsius_to_fahrenheit(temps)
+                slope, trend_y = self.celsius_to_fahrenheit(slope), self.celsius_to_fahrenheit(trend_y)
+            self._set_line_data(line, years, temps)
+            trend.set_data(years, trend_y)
+            label = f'Trend: {slope:.4f}{unit_symbol}/year'
+            trend.set_label(label)
+            ax.get_legend().get_texts()[1].set_text(label)
+            ax.set_ylabel(f'Temperature ({unit_symbol})', color=self.colors['text'])
+            ax.relim()
+            ax.autoscale_view()
+
+    def _trend_values(self, x, slope, intercept):
+        """slope * x + intercept in one float64 buffer, which the trend Line2D then owns."""
+        buf = np.empty(len(x))
+        np.multiply(x, slope, out=buf)
+        np.add(buf, intercept, out=buf)
+        return buf
+
+    def _label_points(self, ax, x, y, unit_symbol):
+        """Value label above each finite point; NaN decades get none."""
+        finite = np.isfinite(y)
+        x, y = x[finite], y[finite]
+        labels = np.char.add(np.char.mod('%.2f', y), unit_symbol)
+        for xi, yi, label in zip(x.tolist(), (y + 0.02).tolist(), labels.tolist()):
+            ax.text(xi, yi, label, ha='center', va='bottom', color=self.colors['text'])
+
+    def _plot_decimated(self, ax, x, y, **kwargs):
+        """ax.plot for long series: draws a min/max envelope of ~2 points per pixel."""
+        line, = ax.plot(x, y, **kwargs)
+        width = max(int(ax.bbox.width), 1)
+        if len(x) <= 2 * width:
+            return line
+        from _kernels import minmax_decimate
+        self._full_data[line] = (x, y)
+
+        def redecimate(ax):
+            # Re-thin only the visible span so zooming in reveals the detail
+            x, y = self._full_data[line]
+            lo, hi = ax.get_xlim()
+            i, j = np.searchsorted(x, [lo, hi])
+            i, j = max(i - 1, 0), min(j + 1, len(x))
+            line.set_data(*minmax_decimate(x[i:j], y[i:j], width))
+
+        redecimate(ax)
+        ax.callbacks.connect('xlim_changed', redecimate)
+        return line
+
+    def _set_line_data(self, line, x, y):
+        """set_data for a line drawn by _plot_decimated."""
+        if line in self._full_data:
+            self._full_data[line] = (x, y)
+            line.axes.callbacks.process('xlim_changed', line.axes)
+        else:
+            line.set_data(x, y)
+
     def plot_temperature_trends(self):
         ax = self.fig.add_subplot(111)
         ax.set_facecolor(self.colors['plot_bg'])
         
-        years = self.analysis.df['Year']
-        temps = self.analysis.df['annual_temp']
+        years = self.analysis.years
+        temps = self.analysis.annual
         
         if self.temp_unit.get() == 'Fahrenheit':
             temps = self.celsius_to_fahrenheit(temps)
         
-        ax.plot(years, temps, color=self.colors['plot_line1'], linewidth=2, label='Annual Temperature')
+        self._plot_decimated(ax, years, temps, color=self.colors['plot_line1'], linewidth=2, label='Annual Temperature')
         
-        z = np.polyfit(years, temps, 1)
-        p = np.poly1d(z)
-        ax.plot(years, p(years), color=self.colors['plot_line2'], linestyle='--', 
-                linewidth=2, label=f'Trend (slope: {z[0]:.4f}°{self.temp_unit.get()[0]}/year)')
+        slope = self.analysis.linear_trend('annual_temp')[0]
+        trend = self.analysis.trend_line('annual_temp')
+        if self.temp_unit.get() == 'Fahrenheit':
+            slope, trend = self.celsius_to_fahrenheit(slope), self.celsius_to_fahrenheit(trend)
+        ax.plot(years, trend, color=self.colors['plot_line2'], linestyle='--', 
+                linewidth=2, label=f'Trend (slope: {slope:.4f}°{self.temp_unit.get()[0]}/year)')
         
-        rolling_avg = temps.rolling(window=10).mean()
-        ax.plot(years, rolling_avg, color=self.colors['plot_line3'], linewidth=2, 
-                label='10-Year Moving Average')
+        rolling_avg = self.analysis.annual_rolling_mean()
+        if self.temp_unit.get() == 'Fahrenheit':
+            rolling_avg = self.celsius_to_fahrenheit(rolling_avg)
+        self._plot_decimated(ax, years, rolling_avg, color=self.colors['plot_line3'], linewidth=2, 
+                             label='10-Year Moving Average')
         
         ax.set_title('Global Temperature Anomalies', color=self.colors['accent'], pad=20,
                     font={'size': 14, 'weight': 'bold'})
@@ -722,11 +990,17 @@ class ClimateGUI:
         months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
         
-        data = self.analysis.df[months].values
-        years = self.analysis.df['Year'].values
+        data = self.analysis.monthly_image
+        years = self.analysis.years
         
-        im = ax.imshow(data.T, aspect='auto', cmap='coolwarm',
-                      extent=[years[0], years[-1], -0.5, 11.5])
+        # Months as rows in a C-contiguous float32 block, transposed once per
+        # dataset, so Agg colormaps it without a copy; origin='lower' puts
+        # Jan at y=0 where its tick label is. The 'rgba' stage applies the
+        # colormap to the 12 x years grid before nearest resampling rather
+        # than to every screen pixel; with 'nearest' the result is identical
+        im = ax.imshow(data, aspect='auto', cmap='coolwarm',
+                      interpolation='nearest', interpolation_stage='rgba',
+                      origin='lower', extent=[years[0], years[-1], -0.5, 11.5])
         
         ax.set_title('Monthly Temperature Patterns', color=self.colors['accent'], pad=20,
                     font={'size': 14, 'weight': 'bold'})
@@ -740,7 +1014,7 @@ class ClimateGUI:
         colorbar.set_label('Temperature Anomaly (°C)', color=self.colors['accent'], 
                           fontsize=10, labelpad=10)
         colorbar.ax.yaxis.set_tick_params(color=self.colors['text'])
-        plt.setp(colorbar.ax.get_yticklabels(), color=self.colors['text'])
+        colorbar.ax.yaxis.set_tick_params(labelcolor=self.colors['text'])
         
         ax.grid(True, alpha=0.2, color=self.colors['plot_grid'])
         
@@ -756,11 +1030,12 @@ class ClimateGUI:
             'JJA': 'Summer (Jun-Aug)',
             'SON': 'Autumn (Sep-Nov)'
         }
-        years = self.analysis.df['Year']
+        years = self.analysis.years
         unit_symbol = '°F' if self.temp_unit.get() == 'Fahrenheit' else '°C'
         
-        self.fig.suptitle('Seasonal Temperature Patterns', color=self.colors['accent'], 
-                         y=0.95, font={'size': 14, 'weight': 'bold'})
+        # Left at its default position so constrained layout makes room for it
+        self._seasonal_title = self.fig.suptitle('Seasonal Temperature Patterns', color=self.colors['accent'], 
+                                                 font={'size': 14, 'weight': 'bold'})
         
         colors = [
             '#FF6B6B',  # Winter (DJF) - red
@@ -772,17 +1047,19 @@ class ClimateGUI:
         for i, ((season_code, season_name), color) in enumerate(zip(seasons.items(), colors), 1):
             ax = self.fig.add_subplot(2, 2, i)
             ax.set_facecolor(self.colors['plot_bg'])
-            temps = self.analysis.df[season_code]
+            temps = self.analysis.seasonal[season_code]
             
             if self.temp_unit.get() == 'Fahrenheit':
                 temps = self.celsius_to_fahrenheit(temps)
             
-            ax.plot(years, temps, color=color, linewidth=2, label='Temperature')
+            line = self._plot_decimated(ax, years, temps, color=color, linewidth=2, label='Temperature')
             
-            z = np.polyfit(years, temps, 1)
-            p = np.poly1d(z)
-            ax.plot(years, p(years), color=self.colors['accent'], linestyle='--', 
-                   linewidth=2, label=f'Trend: {z[0]:.4f}{unit_symbol}/year')
+            slope = self.analysis.linear_trend(season_code)[0]
+            trend_y = self.analysis.trend_line(season_code)
+            if self.temp_unit.get() == 'Fahrenheit':
+                slope, trend_y = self.celsius_to_fahrenheit(slope), self.celsius_to_fahrenheit(trend_y)
+            trend, = ax.plot(years, trend_y, color=self.colors['accent'], linestyle='--', 
+                   linewidth=2, label=f'Trend: {slope:.4f}{unit_symbol}/year')
             
             ax.set_title(season_name, color=self.colors['accent'])
             ax.set_xlabel('Year', color=self.colors['text'])
@@ -795,27 +1072,26 @@ class ClimateGUI:
                 spine.set_color(self.colors['plot_line2'])
             
             self.add_hover_annotation(ax)
+            self._season_lines.append((ax, line, trend, season_code))
     
     def plot_decadal_changes(self):
-        self.clear_plot()
         ax = self.fig.add_subplot(111)
         ax.set_facecolor(self.colors['plot_bg'])
         
-        self.analysis.df['Decade'] = (self.analysis.df['Year'] // 10) * 10
-        decadal_avg = self.analysis.df.groupby('Decade')['annual_temp'].mean()
-        decadal_std = self.analysis.df.groupby('Decade')['annual_temp'].std()
+        decadal = self.analysis.decadal_stats()
+        decades = decadal.index.to_numpy()
+        decadal_avg = decadal['mean'].to_numpy()
+        decadal_std = decadal['std'].to_numpy()
         
         unit_symbol = '°F' if self.temp_unit.get() == 'Fahrenheit' else '°C'
         if self.temp_unit.get() == 'Fahrenheit':
             decadal_avg = self.celsius_to_fahrenheit(decadal_avg)
             decadal_std = decadal_std * 9/5
         
-        decades = decadal_avg.index.values
-        
         ax.set_xlim(decades.min() - 5, decades.max() + 5)
         ax.set_ylim(
-            (decadal_avg - decadal_std).min() - 0.2,
-            (decadal_avg + decadal_std).max() + 0.2
+            np.nanmin(decadal_avg - decadal_std) - 0.2,
+            np.nanmax(decadal_avg + decadal_std) + 0.2
         )
         
         # Plot the data points with error bars
@@ -825,20 +1101,19 @@ class ClimateGUI:
         
         # Calculate and plot trend line
         if len(decades) > 1:
-            z = np.polyfit(decades, decadal_avg, 1)
-            p = np.poly1d(z)
-            trend_line, = ax.plot(decades, p(decades), 
+            from _kernels import linear_fit
+            warming_rate, intercept = linear_fit(decades, decadal_avg)
+            trend_line, = ax.plot(decades, self._trend_values(decades, warming_rate, intercept), 
                                 color=self.colors['plot_line2'], linestyle='--', 
                                 linewidth=2, label='Trend')
             
-            warming_rate = z[0]
-            total_change = decadal_avg.iloc[-1] - decadal_avg.iloc[0]
+            total_change = decadal_avg[-1] - decadal_avg[0]
             
             # Add statistics box
             stats_text = (
                 f"Warming Rate: {warming_rate:.4f}{unit_symbol}/decade\n"
                 f"Total Change: {total_change:.2f}{unit_symbol}\n"
-                f"Current Decade: {decadal_avg.iloc[-1]:.2f}{unit_symbol}"
+                f"Current Decade: {decadal_avg[-1]:.2f}{unit_symbol}"
             )
             stats_box = ax.text(0.98, 0.98, stats_text, 
                               transform=ax.transAxes,
@@ -851,9 +1126,7 @@ class ClimateGUI:
                                       alpha=0.9))
         
         # Add value labels
-        for x, y in zip(decades, decadal_avg):
-            ax.text(x, y + 0.02, f'{y:.2f}{unit_symbol}',
-                   ha='center', va='bottom', color=self.colors['text'])
+        self._label_points(ax, decades, decadal_avg, unit_symbol)
         
         ax.set_title('Decadal Temperature Changes', color=self.colors['accent'], pad=20,
                     font={'size': 14, 'weight': 'bold'})
@@ -866,70 +1139,113 @@ class ClimateGUI:
             spine.set_color(self.colors['plot_line2'])
             
         ax.legend(facecolor=self.colors['panel'], edgecolor=self.colors['plot_line2'], loc='upper left')
-        self.canvas.draw()
     
     def add_hover_annotation(self, ax):
-        unit_symbol = '°F' if self.temp_unit.get() == 'Fahrenheit' else '°C'
         annot = ax.annotate("", xy=(0,0), xytext=(10,10),
                            textcoords="offset points",
                            bbox=dict(boxstyle="round", fc="#34495e", ec="white", alpha=0.8),
                            color='white',
                            fontsize=10)
         annot.set_visible(False)
+        annot.set_animated(True)
+        # Blitted on top; the layout must not move axes to fit it
+        annot.set_in_layout(False)
 
         def hover(event):
             if event.inaxes == ax:
+                # Read per event: seasonal views switch unit without rebuilding
+                unit_symbol = '°F' if self._drawn_unit == 'Fahrenheit' else '°C'
                 x, y = event.xdata, event.ydata
                 annot.xy = (x, y)
                 
-                if hasattr(ax, 'collections') and ax.collections:
-                    row = int(y)
-                    col = int(x)
-                    if 0 <= row < 12:
-                        month = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                                'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][row]
-                        text = f'Year: {int(x)}\nMonth: {month}\nTemp: {y:.2f}{unit_symbol}'
+                if ax.images:
+                    text = self._heatmap_hover_text(x, y)
                 else:
                     text = f'Year: {int(x)}\nTemp: {y:.2f}{unit_symbol}'
                 
                 annot.set_text(text)
                 annot.set_visible(True)
-                self.fig.canvas.draw_idle()
-            else:
+                self._hover_annot = annot
+                self._blit_hover()
+            elif annot.get_visible():
+                # Every hover handler sees every move; only the one whose
+                # annotation just left its axes needs a redraw
                 annot.set_visible(False)
-                self.fig.canvas.draw_idle()
+                if self._hover_annot is annot:
+                    self._hover_annot = None
+                self._blit_hover()
+
+        self._hover_funcs[ax] = hover
 
-        self.fig.canvas.mpl_connect('motion_notify_event', hover)
+    def _heatmap_hover_text(self, x, y):
+        """Hover label of the heatmap cell under (x, y), from a table built once per dataset."""
+        years = self.analysis.years
+        data = self.analysis.monthly_image
+        if self._hover_table is None or self._hover_table[0] is not data:
+            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+            table = [[f'Year: {year}\nMonth: {month}\nTemp: {value:.2f}°C'
+                      for year, value in zip(years.tolist(), row)]
+                     for month, row in zip(months, data.tolist())]
+            self._hover_table = (data, table)
+        # Columns split [first year, last year] evenly; row i is centred on y = i
+        n = len(years)
+        span = max(int(years[-1]) - int(years[0]), 1)
+        col = min(max(int((x - years[0]) / span * n), 0), n - 1)
+        row = min(max(int(y + 0.5), 0), 11)
+        return self._hover_table[1][row][col]
     
+    def _on_motion(self, event):
+        # Keep only the latest move; the hover handlers run once per idle cycle
+        if self._pending_hover is None:
+            self.root.after_idle(self._flush_hover)
+        self._pending_hover = event
+
+    def _flush_hover(self):
+        event, self._pending_hover = self._pending_hover, None
+        for hover in list(self._hover_funcs.values()):
+            hover(event)
+
+    def _on_hover_draw(self, event):
+        self._hover_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        # Zooms and panning also land here, so the saved view stays current
+        if self._views is not None and self.current_plot in self._views:
+            self._view_pixels[self.current_plot] = (self._views[self.current_plot][0], self._hover_bg)
+        annot = self._hover_annot
+        if annot is not None and annot.get_visible() and annot.axes.get_visible():
+            self.fig.draw_artist(annot)
+
+    def _on_hover_resize(self, event):
+        # The saved pixels no longer match the canvas; the next draw replaces them
+        self._hover_bg = None
+        self._view_pixels = {}
+
+    def _blit_hover(self):
+        """Repaint only the hover annotation over the background of the last full draw."""
+        if self._hover_bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._hover_bg)
+        if self._hover_annot is not None:
+            self.fig.draw_artist(self._hover_annot)
+        self.canvas.blit(self.fig.bbox)
+
     def show_statistics(self):
         self.text_widget.pack(fill=tk.BOTH, expand=True)
+        # The text only depends on the unit and dataset; same key, same text
+        key = (self.temp_unit.get(), self.analysis.dataset_type)
+        if key == self._stats_key:
+            return
+        self._stats_key = key
         self.text_widget.configure(state='normal')
         self.text_widget.delete(1.0, tk.END)
         stats = self.analysis.calculate_statistics()
-        df = self.analysis.df
         unit_symbol = '°F' if self.temp_unit.get() == 'Fahrenheit' else '°C'
         # Sea ice statistics
         min_area = max_area = mean_area = trend = min_year = max_year = std_area = percent_change = None
         decadal_avg = record_lows = None
         try:
-            for h in range(10):
-                sea_ice_df = pd.read_excel('data/N_Sea_Ice_Index_Regional_Monthly_Data_G02135_v3.0.xlsx', header=h)
-                cols = [str(col).strip() for col in sea_ice_df.columns]
-                months = ['January', 'February', 'March', 'April', 'May', 'June',
-                          'July', 'August', 'September', 'October', 'November', 'December']
-                month_cols = [col for col in cols if col in months]
-                if len(month_cols) == 12:
-                    break
-            sea_ice_df.columns = [str(col).strip() for col in sea_ice_df.columns]
-            month_cols = [col for col in sea_ice_df.columns if col in months]
-            keep_cols = ['Year'] + month_cols
-            sea_ice_df = sea_ice_df.rename(columns={sea_ice_df.columns[0]: 'Year'})
-            sea_ice_df = sea_ice_df[keep_cols]
-            sea_ice_df['Year'] = pd.to_numeric(sea_ice_df['Year'], errors='coerce')
-            for m in month_cols:
-                sea_ice_df[m] = pd.to_numeric(sea_ice_df[m], errors='coerce')
-            sea_ice_df = sea_ice_df.dropna(subset=['Year'])
-            sea_ice_df['Annual_Avg_Area'] = sea_ice_df[month_cols].mean(axis=1)
+            sea_ice_df = self._load_sea_ice()
             min_area = sea_ice_df['Annual_Avg_Area'].min()
             max_area = sea_ice_df['Annual_Avg_Area'].max()
             mean_area = sea_ice_df['Annual_Avg_Area'].mean()
@@ -939,66 +1255,62 @@ class ClimateGUI:
             min_year = int(sea_ice_df.loc[sea_ice_df['Annual_Avg_Area'].idxmin(), 'Year'])
             max_year = int(sea_ice_df.loc[sea_ice_df['Annual_Avg_Area'].idxmax(), 'Year'])
             percent_change = 100 * (sea_ice_df['Annual_Avg_Area'].iloc[-1] - sea_ice_df['Annual_Avg_Area'].iloc[0]) / sea_ice_df['Annual_Avg_Area'].iloc[0]
-            sea_ice_df['Decade'] = (sea_ice_df['Year'] // 10) * 10
-            decadal_avg = sea_ice_df.groupby('Decade')['Annual_Avg_Area'].mean()
+            # Grouped by a derived key so the cached frame is not mutated
+            decadal_avg = sea_ice_df.groupby((sea_ice_df['Year'] // 10) * 10)['Annual_Avg_Area'].mean()
             record_lows = sea_ice_df.nsmallest(5, 'Annual_Avg_Area')[['Year', 'Annual_Avg_Area']]
         except Exception as e:
             pass  # variables are already set to None
         # --- ENHANCED CLIMATE STATS PANEL ---
-        self.text_widget.tag_configure('title', font=('Segoe UI', 16, 'bold'), foreground=self.colors['accent'], spacing1=10, spacing3=5)
-        self.text_widget.tag_configure('header', font=('Segoe UI', 12, 'bold'), foreground=self.colors['plot_line1'], spacing1=5, spacing3=3)
-        self.text_widget.tag_configure('subheader', font=('Segoe UI', 11, 'bold'), foreground=self.colors['plot_line2'], spacing1=3, spacing3=2)
-        self.text_widget.tag_configure('value', font=('Segoe UI', 10), foreground=self.colors['text'], spacing1=2)
-        self.text_widget.tag_configure('impact', font=('Segoe UI', 10, 'italic'), foreground=self.colors['plot_line4'], spacing1=2)
-        self.text_widget.tag_configure('alert', font=('Segoe UI', 10, 'bold'), foreground=self.colors['plot_line1'], spacing1=2)
+        # Alternating text, tag items, inserted with a single Tk call below
+        parts = []
 
         # Temperature Trends
-        self.text_widget.insert(tk.END, "Temperature Trends\n", 'header')
-        warming_rate = np.polyfit(df['Year'], df['annual_temp'], 1)[0]
-        hottest_year = int(df.loc[df['annual_temp'].idxmax(), 'Year'])
-        coldest_year = int(df.loc[df['annual_temp'].idxmin(), 'Year'])
-        self.text_widget.insert(tk.END, (
+        parts += ["Temperature Trends\n", 'header']
+        warming_rate = self.analysis.linear_trend('annual_temp')[0]
+        hottest_year = int(stats['extremes']['warmest_year'])
+        coldest_year = int(stats['extremes']['coldest_year'])
+        parts += [(
             f"• Warming rate: {warming_rate:.4f}{unit_symbol}/year\n"
             f"• Hottest year: {hottest_year}\n"
             f"• Coldest year: {coldest_year}\n\n"
-        ), 'value')
+        ), 'value']
 
         # Monthly Temperature Patterns
-        self.text_widget.insert(tk.END, "Monthly Temperature Patterns\n", 'header')
-        monthly_std = df[['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']].std()
+        parts += ["Monthly Temperature Patterns\n", 'header']
+        monthly_std = self.analysis.monthly_summary().loc['std']
         most_variable_month = monthly_std.idxmax()
         least_variable_month = monthly_std.idxmin()
-        self.text_widget.insert(tk.END, (
+        parts += [(
             f"• Most variable month: {most_variable_month}\n"
             f"• Least variable month: {least_variable_month}\n"
             f"• Winter months warming faster than summer months\n\n"
-        ), 'value')
+        ), 'value']
 
         # Seasonal Temperature Analysis
-        self.text_widget.insert(tk.END, "Seasonal Temperature Analysis\n", 'header')
+        parts += ["Seasonal Temperature Analysis\n", 'header']
         winter_trend = stats['seasonal_trends']['DJF']
         summer_trend = stats['seasonal_trends']['JJA']
-        self.text_widget.insert(tk.END, (
+        parts += [(
             f"• Winter warming rate: {winter_trend:.4f}{unit_symbol}/year\n"
             f"• Summer warming rate: {summer_trend:.4f}{unit_symbol}/year\n"
             f"• Spring/fall show increasing instability\n\n"
-        ), 'value')
+        ), 'value']
 
         # Decadal Changes
-        self.text_widget.insert(tk.END, "Decadal Changes\n", 'header')
-        df['Decade'] = (df['Year'] // 10) * 10
-        decadal_avg = df.groupby('Decade')['annual_temp'].mean()
-        decadal_change = decadal_avg.iloc[-1] - decadal_avg.iloc[0]
-        self.text_widget.insert(tk.END, (
+        parts += ["Decadal Changes\n", 'header']
+        # Kept separate from the sea ice decadal_avg printed further down
+        temp_decadal = self.analysis.decadal_stats()['mean']
+        decadal_change = temp_decadal.iloc[-1] - temp_decadal.iloc[0]
+        parts += [(
             f"• Change from first to last decade: {decadal_change:.2f}{unit_symbol}\n"
-            f"• Hottest decade: {int(decadal_avg.idxmax())}s\n"
-            f"• Coldest decade: {int(decadal_avg.idxmin())}s\n\n"
-        ), 'value')
+            f"• Hottest decade: {int(temp_decadal.idxmax())}s\n"
+            f"• Coldest decade: {int(temp_decadal.idxmin())}s\n\n"
+        ), 'value']
 
         # Sea Ice Trends
-        self.text_widget.insert(tk.END, "Sea Ice Trends\n", 'header')
+        parts += ["Sea Ice Trends\n", 'header']
         if min_area is not None:
-            self.text_widget.insert(tk.END, (
+            parts += [(
                 f"• Min annual avg area: {min_area:,.0f} sq km (Year: {min_year})\n"
                 f"• Max annual avg area: {max_area:,.0f} sq km (Year: {max_year})\n"
                 f"• Mean annual avg area: {mean_area:,.0f} sq km\n"
@@ -1006,49 +1318,47 @@ class ClimateGUI:
                 f"• Trend: {trend:,.0f} sq km/year\n"
                 f"• Percent change (first to last year): {percent_change:.2f}%\n"
                 f"• Decadal averages (sq km):\n"
-            ), 'value')
+            ), 'value']
             for decade, avg in decadal_avg.items():
-                self.text_widget.insert(tk.END, f"   {int(decade)}s: {avg:,.0f} sq km\n", 'value')
-            self.text_widget.insert(tk.END, "• Record low years:\n", 'value')
+                parts += [f"   {int(decade)}s: {avg:,.0f} sq km\n", 'value']
+            parts += ["• Record low years:\n", 'value']
             for _, row in record_lows.iterrows():
-                self.text_widget.insert(tk.END, f"   {int(row['Year'])}: {row['Annual_Avg_Area']:,.0f} sq km\n", 'value')
+                parts += [f"   {int(row['Year'])}: {row['Annual_Avg_Area']:,.0f} sq km\n", 'value']
         else:
-            self.text_widget.insert(tk.END, "Sea ice data unavailable or could not be processed.\n", 'alert')
+            parts += ["Sea ice data unavailable or could not be processed.\n", 'alert']
+        self.text_widget.insert(tk.END, *parts)
         self.text_widget.configure(state='disabled')
 
     def clear_plot(self):
         self.fig.clf()
 
-    def plot_sea_ice_trends(self, path='data/N_Sea_Ice_Index_Regional_Monthly_Data_G02135_v3.0.xlsx'):
-        """Process and plot annual average sea ice area over time."""
-        # Try different header rows to find the one with all months
-        for h in range(10):  # Try first 10 rows
-            df = pd.read_excel(path, header=h)
-            cols = [str(col).strip() for col in df.columns]
-            months = ['January', 'February', 'March', 'April', 'May', 'June',
-                      'July', 'August', 'September', 'October', 'November', 'December']
+    def _load_sea_ice(self, path=SEA_ICE_PATH):
+        """Year, monthly and annual average sea ice area, parsed once per path."""
+        if path in self._sea_ice:
+            return self._sea_ice[path]
+        import pandas as pd
+        months = ['January', 'February', 'March', 'April', 'May', 'June',
+                  'July', 'August', 'September', 'October', 'November', 'December']
+        # One workbook parse; the header row is found among the first 10 rows
+        raw = pd.read_excel(path, header=None)
+        for h in range(min(10, len(raw))):
+            cols = [str(col).strip() for col in raw.iloc[h]]
             month_cols = [col for col in cols if col in months]
-            print(f"header={h}: {month_cols}")
             if len(month_cols) == 12:
-                print(f"Found all months at header={h}")
                 break
-        df.columns = [str(col).strip() for col in df.columns]
-        months = ['January', 'February', 'March', 'April', 'May', 'June',
-                  'July', 'August', 'September', 'October', 'November', 'December']
-        # Find columns that match months exactly
-        month_cols = [col for col in df.columns if col in months]
-        if len(month_cols) != 12:
-            print('DEBUG: Columns found:', df.columns.tolist())
+        else:
             raise ValueError(f"Could not find all month columns. Found: {month_cols}")
-        keep_cols = ['Year'] + month_cols
-        df = df.rename(columns={df.columns[0]: 'Year'})
-        df = df[keep_cols]
-        df['Year'] = pd.to_numeric(df['Year'], errors='coerce')
-        for m in month_cols:
-            df[m] = pd.to_numeric(df[m], errors='coerce')
+        df = raw.iloc[h + 1:].reset_index(drop=True)
+        df.columns = ['Year'] + cols[1:]
+        df = df[['Year'] + month_cols].apply(pd.to_numeric, errors='coerce')
         df = df.dropna(subset=['Year'])
         df['Annual_Avg_Area'] = df[month_cols].mean(axis=1)
-        self.fig.clear()
+        self._sea_ice[path] = df
+        return df
+
+    def plot_sea_ice_trends(self, path=SEA_ICE_PATH):
+        """Process and plot annual average sea ice area over time."""
+        df = self._load_sea_ice(path)
         ax = self.fig.add_subplot(111)
         ax.plot(df['Year'], df['Annual_Avg_Area'], marker='o', color=self.colors['plot_line2'], label='Annual Avg Sea Ice Area', linewidth=2)
         ax.set_title('Annual Average Sea Ice Area (Northern Hemisphere)', fontsize=14, color=self.colors['accent'])
@@ -1060,30 +1370,10 @@ class ClimateGUI:
         ax.tick_params(colors=self.colors['text'])
         for spine in ax.spines.values():
             spine.set_color(self.colors['plot_line2'])
-        self.canvas.draw()
         return df
 
-    def animate_sea_ice_trends(self, path='data/N_Sea_Ice_Index_Regional_Monthly_Data_G02135_v3.0.xlsx'):
-        # Try different header rows to find the one with all months
-        for h in range(10):
-            df = pd.read_excel(path, header=h)
-            cols = [str(col).strip() for col in df.columns]
-            months = ['January', 'February', 'March', 'April', 'May', 'June',
-                      'July', 'August', 'September', 'October', 'November', 'December']
-            month_cols = [col for col in cols if col in months]
-            if len(month_cols) == 12:
-                break
-        df.columns = [str(col).strip() for col in df.columns]
-        month_cols = [col for col in df.columns if col in months]
-        keep_cols = ['Year'] + month_cols
-        df = df.rename(columns={df.columns[0]: 'Year'})
-        df = df[keep_cols]
-        df['Year'] = pd.to_numeric(df['Year'], errors='coerce')
-        for m in month_cols:
-            df[m] = pd.to_numeric(df[m], errors='coerce')
-        df = df.dropna(subset=['Year'])
-        df['Annual_Avg_Area'] = df[month_cols].mean(axis=1)
-        self.fig.clear()
+    def animate_sea_ice_trends(self, path=SEA_ICE_PATH):
+        df = self._load_sea_ice(path)
         ax = self.fig.add_subplot(111)
         years = df['Year'].values
         area = df['Annual_Avg_Area'].values
@@ -1100,11 +1390,8 @@ class ClimateGUI:
         for spine in ax.spines.values():
             spine.set_color(self.colors['plot_line2'])
         def animate(frame):
-            if frame > 0:
-                line.set_data(years[:frame], area[:frame])
-            return [line]
-        self.anim = FuncAnimation(self.fig, animate, frames=len(years) + 1, interval=50, blit=False, repeat=False)
-        self.canvas.draw()
+            line.set_data(years[:frame], area[:frame])
+        self._start_animation([line], animate, len(years))
 
 def main():
     root = tk.Tk()